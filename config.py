@@ -3,25 +3,35 @@ Configuration loader for the Pastor Tara Advisor bot.
 Loads all environment variables from .env file.
 """
 import os
+from typing import Final, FrozenSet
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+
+def _parse_ids(value: str) -> FrozenSet[int]:
+    """Parse a comma-separated list of Telegram IDs, skipping invalid entries."""
+    return frozenset(
+        int(item) for item in (part.strip() for part in value.split(","))
+        if item.removeprefix("-").isdecimal()
+    )
+
+
 # Telegram Bot Configuration
-TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
-TELEGRAM_ADMIN_IDS = [int(id.strip()) for id in os.getenv("TELEGRAM_ADMIN_IDS", "").split(",") if id.strip()]
+TELEGRAM_TOKEN: Final = os.getenv("TELEGRAM_TOKEN")
+TELEGRAM_ADMIN_IDS: Final = _parse_ids(os.getenv("TELEGRAM_ADMIN_IDS", ""))  # frozenset for O(1) admin checks
 
 # OpenAI Configuration
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_API_KEY: Final = os.getenv("OPENAI_API_KEY")
 
 # Telegram API for scraping (get from my.telegram.org)
-TELEGRAM_API_ID = os.getenv("TELEGRAM_API_ID")
-TELEGRAM_API_HASH = os.getenv("TELEGRAM_API_HASH")
-TELEGRAM_PHONE = os.getenv("TELEGRAM_PHONE")
+TELEGRAM_API_ID: Final = os.getenv("TELEGRAM_API_ID")
+TELEGRAM_API_HASH: Final = os.getenv("TELEGRAM_API_HASH")
+TELEGRAM_PHONE: Final = os.getenv("TELEGRAM_PHONE")
 
 # Channels to scrape
-CHANNELS_TO_SCRAPE = [
+CHANNELS_TO_SCRAPE: Final = [
     "@pst_tara",
     "@TheSupernaturalBusinessMan",
     "@TheSupernaturalFamily",
@@ -29,18 +39,33 @@ CHANNELS_TO_SCRAPE = [
 ]
 
 # Database paths
-DB_PATH = "db/sermons.db"
-CHROMA_PATH = "db/chroma"
-CACHE_PATH = "cache"
-MATERIALS_PATH = "materials"
-LOGS_PATH = "logs"
+DB_PATH: Final = "db/sermons.db"
+CHROMA_PATH: Final = "db/chroma"
+CHROMA_COLLECTION: Final = "sermons"
+# HNSW index settings, fixed when the collection is created
+CHROMA_HNSW_SETTINGS: Final = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64,
+}
+CACHE_PATH: Final = "cache"
+LLM_CACHE_PATH: Final = "cache/llm_cache.db"
+RESPONSE_CACHE_PATH: Final = "cache/response_cache.db"
+MATERIALS_PATH: Final = "materials"
+LOGS_PATH: Final = "logs"
 
 # AI Configuration
-AI_MODEL = "gpt-4o-mini"
-EMBEDDING_MODEL = "text-embedding-3-small"
-CACHE_DURATION_HOURS = 6
+AI_MODEL: Final = "gpt-4o-mini"
+EMBEDDING_MODEL: Final = "text-embedding-3-small"
+CACHE_DURATION_HOURS: Final = 6
+CHROMA_ADD_BATCH_SIZE: Final = 128  # Documents per vector store insert
 
 # Search Configuration
-TOP_K_SEARCH = 20  # Initial retrieval
-MIN_RELEVANCE_SCORE = 0.7  # Minimum score to recommend
-DEFAULT_RECOMMENDATIONS = 5  # Default number of recommendations
\ No newline at end of file
+TOP_K_SEARCH: Final = 20  # Initial retrieval
+MIN_RELEVANCE_SCORE: Final = 0.7  # Minimum score to recommend
+RERANKER_MODEL: Final = "BAAI/bge-reranker-base"  # Local cross-encoder (needs sentence-transformers)
+RERANK_MIN_SCORE: Final = 0.3  # Minimum cross-encoder score to recommend
+RANK_SKIP_MARGIN: Final = 0.1  # Top-1 lead over top-2 similarity that makes reranking pointless
+RANK_SKIP_MAX_WORDS: Final = 3  # Queries this short are ranked by similarity alone
+DEFAULT_RECOMMENDATIONS: Final = 5  # Default number of recommendations
\ No newline at end of file
@@ -4,13 +4,93 @@ Uses SQLite for fast, reliable storage of thousands of sermons.
 """
 import sqlite3
 import json
+import hashlib
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Sequence
 import os
+import threading
+from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Columns callers may request from iter_sermons()
+SERMON_COLUMNS = (
+    'id', 'title', 'description', 'channel', 'message_link',
+    'image_url', 'date', 'theme', 'content_hash', 'created_at', 'updated_at'
+)
+
+# Vector-store metadata fields, in the order iter_sermon_metadata() returns them
+METADATA_COLUMNS = (
+    'title', 'description', 'channel', 'message_link', 'image_url', 'date', 'theme'
+)
+
+
+def compute_content_hash(*fields) -> str:
+    """Stable hash of a sermon's vector-store fields (blake2b, 128-bit)."""
+    content = '\x1f'.join('' if f is None else str(f) for f in fields)
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# Database files whose schema has already been created in this process
+_schema_initialized: set = set()
+_schema_lock = threading.Lock()
+
+# Hot-path statements, kept as constants so the exact same SQL string is
+# reused on the persistent connection and hits sqlite3's statement cache
+_SQL_INSERT_SERMON = """
+    INSERT OR REPLACE INTO sermons
+    (title, description, channel, message_link, image_url, date, theme, content_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_BY_LINK = "SELECT * FROM sermons WHERE message_link = ?"
+_SQL_GET_ALL = "SELECT * FROM sermons ORDER BY date DESC"
+# Joined inside the LIMIT: stale FTS rowids with no sermon row never fill a slot
+_SQL_SEARCH_FTS = """
+    SELECT sermons.* FROM sermons_fts
+    JOIN sermons ON sermons.id = sermons_fts.rowid
+    WHERE sermons_fts MATCH ?
+    ORDER BY bm25(sermons_fts, 10.0, 1.0, 5.0)
+    LIMIT ?
+"""
+_SQL_ITER_METADATA = """
+    SELECT title, description, channel, message_link,
+           COALESCE(image_url, ''), COALESCE(date, ''), COALESCE(theme, ''),
+           content_hash
+    FROM sermons ORDER BY date DESC
+"""
+_SQL_GET_BY_CHANNEL = "SELECT * FROM sermons WHERE channel = ? ORDER BY date DESC"
+_SQL_GET_LINKS_BY_CHANNEL = "SELECT message_link FROM sermons WHERE channel = ?"
+_SQL_GET_COUNT = "SELECT value FROM stats WHERE key = 'sermon_count'"
+
+# Direct FTS writes used by add_sermons_bulk() while the triggers are dropped
+_SQL_FTS_INSERT = "INSERT INTO sermons_fts(rowid, title, description, theme) VALUES (?, ?, ?, ?)"
+_SQL_FTS_DELETE = """
+    INSERT INTO sermons_fts(sermons_fts, rowid, title, description, theme)
+    VALUES ('delete', ?, ?, ?, ?)
+"""
+
+# FTS sync triggers, dropped and recreated by bulk_load_mode()
+_FTS_TRIGGERS = {
+    'sermons_ai': """
+        CREATE TRIGGER IF NOT EXISTS sermons_ai AFTER INSERT ON sermons BEGIN
+            INSERT INTO sermons_fts(rowid, title, description, theme)
+            VALUES (new.id, new.title, new.description, new.theme);
+        END
+    """,
+    'sermons_ad': """
+        CREATE TRIGGER IF NOT EXISTS sermons_ad AFTER DELETE ON sermons BEGIN
+            DELETE FROM sermons_fts WHERE rowid = old.id;
+        END
+    """,
+    'sermons_au': """
+        CREATE TRIGGER IF NOT EXISTS sermons_au AFTER UPDATE ON sermons BEGIN
+            UPDATE sermons_fts SET title=new.title, description=new.description, 
+                theme=new.theme WHERE rowid=new.id;
+        END
+    """,
+}
+
 
 class SermonDatabase:
     """Handles all database operations for sermons."""
@@ -18,18 +98,73 @@ class SermonDatabase:
     def __init__(self, db_path: str):
         """Initialize database connection and create tables if needed."""
         self.db_path = db_path
+        schema_ready = db_path != ":memory:" and db_path in _schema_initialized
         
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not schema_ready:
+            os.makedirs(db_dir, exist_ok=True)
+        
+        # One persistent connection per instance, shared across threads.
+        # Autocommit mode: reads run without a transaction, writes that need
+        # one open it with BEGIN IMMEDIATE to take the writer lock up front
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._apply_pragmas(self._conn)
+        
+        # Set when writes fragment the FTS index; cleared by optimize_search_index()
+        self._fts_dirty = False
         
-        # Initialize database
-        self._init_db()
+        # bulk_load_mode() state: triggers dropped, and whether a write bypassed
+        # the direct FTS path so the index must be rebuilt on exit
+        self._bulk_mode = False
+        self._fts_rebuild_needed = False
+        
+        # Initialize database (once per process per file)
+        if not schema_ready:
+            self._init_db()
     
-    def _init_db(self):
-        """Create tables with optimized schema for thousands of records."""
-        conn = sqlite3.connect(self.db_path)
+    def close(self):
+        """Close the underlying connection (call on shutdown)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                logger.info("Database connection closed")
+    
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        """Tune the connection for concurrent reads while the scraper writes."""
         cursor = conn.cursor()
         
+        # WAL is persistent on the file, so only set it for on-disk databases
+        if self.db_path != ":memory:":
+            cursor.execute("PRAGMA journal_mode=WAL")
+        
+        # Per-connection settings (cheap to re-assert on every connect)
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+        
+        # Make INSERT OR REPLACE fire the delete triggers for the row it replaces
+        cursor.execute("PRAGMA recursive_triggers=ON")
+    
+    def _init_db(self):
+        """Create tables with optimized schema for thousands of records."""
+        with _schema_lock, self._lock:
+            self._create_schema(self._conn.cursor())
+            if self.db_path != ":memory:":
+                _schema_initialized.add(self.db_path)
+        logger.info("Database initialized successfully")
+    
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables, indexes and FTS triggers if they don't exist."""
         # Main sermons table with indexes for fast search
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS sermons (
@@ -45,9 +180,13 @@ class SermonDatabase:
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        self._migrate_content_hash(cursor)
         
         # Create indexes for fast lookup
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_channel ON sermons(channel)")
+        # (channel, date DESC) serves get_sermons_by_channel without a sort step
+        # and supersedes the old single-column idx_channel
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_channel_date ON sermons(channel, date DESC)")
+        cursor.execute("DROP INDEX IF EXISTS idx_channel")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_date ON sermons(date)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_theme ON sermons(theme)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_title ON sermons(title)")
@@ -55,60 +194,92 @@ class SermonDatabase:
         # Full-text search index for title and description
         cursor.execute("""
             CREATE VIRTUAL TABLE IF NOT EXISTS sermons_fts USING fts5(
-                title, description, theme, content='sermons', content_rowid='id'
+                title, description, theme, content='sermons', content_rowid='id',
+                prefix='2 3 4'
             )
         """)
         
-        # Trigger to keep FTS table in sync
+        # Triggers to keep FTS table in sync
+        for trigger_sql in _FTS_TRIGGERS.values():
+            cursor.execute(trigger_sql)
+        
+        # Hash of each sermon as last written to the vector store
         cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS sermons_ai AFTER INSERT ON sermons BEGIN
-                INSERT INTO sermons_fts(rowid, title, description, theme)
-                VALUES (new.id, new.title, new.description, new.theme);
-            END
+            CREATE TABLE IF NOT EXISTS vector_hashes (
+                message_link TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL
+            )
+        """)
+        
+        # Precomputed aggregates (COUNT(*) is a full B-tree scan in SQLite)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS stats (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        
+        # Backfill once from the existing rows
+        cursor.execute("""
+            INSERT OR IGNORE INTO stats (key, value)
+            SELECT 'sermon_count', COUNT(*) FROM sermons
         """)
         
         cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS sermons_ad AFTER DELETE ON sermons BEGIN
-                DELETE FROM sermons_fts WHERE rowid = old.id;
+            CREATE TRIGGER IF NOT EXISTS sermons_count_ai AFTER INSERT ON sermons BEGIN
+                UPDATE stats SET value = value + 1 WHERE key = 'sermon_count';
             END
         """)
         
         cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS sermons_au AFTER UPDATE ON sermons BEGIN
-                UPDATE sermons_fts SET title=new.title, description=new.description, 
-                    theme=new.theme WHERE rowid=new.id;
+            CREATE TRIGGER IF NOT EXISTS sermons_count_ad AFTER DELETE ON sermons BEGIN
+                UPDATE stats SET value = value - 1 WHERE key = 'sermon_count';
             END
         """)
+    
+    def _migrate_content_hash(self, cursor: sqlite3.Cursor):
+        """Add the content_hash column to older databases and backfill it."""
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(sermons)")}
+        if 'content_hash' not in columns:
+            cursor.execute("ALTER TABLE sermons ADD COLUMN content_hash TEXT")
         
-        conn.commit()
-        conn.close()
-        logger.info("Database initialized successfully")
+        cursor.execute(f"""
+            SELECT id, {', '.join(METADATA_COLUMNS)} FROM sermons
+            WHERE content_hash IS NULL
+        """)
+        updates = [(compute_content_hash(*row[1:]), row[0]) for row in cursor.fetchall()]
+        if updates:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany("UPDATE sermons SET content_hash = ? WHERE id = ?", updates)
+            cursor.execute("COMMIT")
+            logger.info(f"Backfilled content hash for {len(updates)} sermons")
+    
+    @staticmethod
+    def _sermon_row(sermon_data: Dict) -> tuple:
+        """Pack a sermon dict into the column order used by the INSERT."""
+        row = (
+            sermon_data.get('title', ''),
+            sermon_data.get('description', ''),
+            sermon_data.get('channel', ''),
+            sermon_data.get('message_link', ''),
+            sermon_data.get('image_url'),
+            sermon_data.get('date'),
+            sermon_data.get('theme', '')
+        )
+        return row + (compute_content_hash(*row),)
     
     def add_sermon(self, sermon_data: Dict) -> Optional[int]:
         """Add a new sermon to the database."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_INSERT_SERMON, self._sermon_row(sermon_data))
+                sermon_id = cursor.lastrowid
+                self._fts_dirty = True
+                if self._bulk_mode:
+                    self._fts_rebuild_needed = True
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO sermons 
-                (title, description, channel, message_link, image_url, date, theme)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                sermon_data.get('title', ''),
-                sermon_data.get('description', ''),
-                sermon_data.get('channel', ''),
-                sermon_data.get('message_link', ''),
-                sermon_data.get('image_url'),
-                sermon_data.get('date'),
-                sermon_data.get('theme', '')
-            ))
-            
-            sermon_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Added sermon: {sermon_data.get('title', 'Untitled')}")
+            logger.debug("Added sermon: %s", sermon_data.get('title', 'Untitled'))
             return sermon_id
             
         except sqlite3.IntegrityError:
@@ -118,82 +289,251 @@ class SermonDatabase:
             logger.error(f"Error adding sermon: {e}")
             return None
     
+    def add_sermons_bulk(self, sermons: List[Dict]) -> int:
+        """
+        Add many sermons in a single transaction.
+        One commit (and one fsync) for the whole batch instead of one per row.
+        """
+        if not sermons:
+            return 0
+        
+        rows = [self._sermon_row(sermon) for sermon in sermons]
+        
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                
+                # In bulk load mode the FTS triggers are gone, so keep the index
+                # in sync with two executemany passes instead of per-row triggers
+                direct_fts = self._bulk_mode
+                if direct_fts:
+                    links = [row[3] for row in rows]
+                    cursor.executemany(_SQL_FTS_DELETE, self._fts_rows(cursor, links))
+                
+                cursor.executemany(_SQL_INSERT_SERMON, rows)
+                
+                if direct_fts:
+                    cursor.executemany(_SQL_FTS_INSERT, self._fts_rows(cursor, links))
+                
+                cursor.execute("COMMIT")
+                self._fts_dirty = True
+            except Exception as e:
+                # BEGIN itself may have failed (e.g. SQLITE_BUSY): nothing to undo
+                if self._conn.in_transaction:
+                    cursor.execute("ROLLBACK")
+                logger.error(f"Error adding sermons in bulk: {e}")
+                return 0
+        
+        logger.info(f"Added {len(sermons)} sermons")
+        return len(sermons)
+    
+    @staticmethod
+    def _fts_rows(cursor: sqlite3.Cursor, message_links: List[str]) -> List[tuple]:
+        """Get (id, title, description, theme) for the given links, if present."""
+        fts_rows = []
+        for i in range(0, len(message_links), 500):
+            chunk = message_links[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f"SELECT id, title, description, theme FROM sermons "
+                f"WHERE message_link IN ({placeholders})",
+                chunk
+            )
+            fts_rows.extend(tuple(row) for row in cursor.fetchall())
+        return fts_rows
+    
     def get_sermon_by_link(self, message_link: str) -> Optional[Dict]:
         """Get a sermon by its message link."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM sermons WHERE message_link = ?", (message_link,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(_SQL_GET_BY_LINK, (message_link,))
+            row = cursor.fetchone()
         
         if row:
             return dict(row)
         return None
     
+    def get_sermons_by_links(self, message_links: List[str]) -> List[Dict]:
+        """Get sermons for the given links, in the same order (unknown links skipped)."""
+        if not message_links:
+            return []
+        
+        with self._lock:
+            cursor = self._conn.cursor()
+            placeholders = ','.join('?' * len(message_links))
+            cursor.execute(
+                f"SELECT * FROM sermons WHERE message_link IN ({placeholders})",
+                list(message_links)
+            )
+            rows = {row['message_link']: row for row in cursor.fetchall()}
+        
+        return [dict(rows[link]) for link in message_links if link in rows]
+    
     def get_all_sermons(self) -> List[Dict]:
         """Get all sermons from the database."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM sermons ORDER BY date DESC")
-        rows = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(_SQL_GET_ALL)
+            rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     
-    def search_sermons(self, query: str, limit: int = 50) -> List[Dict]:
-        """Full-text search in sermons."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    def iter_sermons(
+        self,
+        columns: Sequence[str] = ('title', 'description', 'channel', 'message_link',
+                                  'image_url', 'date', 'theme'),
+        batch_size: int = 1000
+    ) -> Iterator[tuple]:
+        """
+        Stream sermons as plain tuples in the requested column order.
+        Avoids building a dict per row when callers only need a few fields.
+        """
+        unknown = [c for c in columns if c not in SERMON_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown sermon columns: {unknown}")
         
-        # Use FTS5 for fast full-text search
-        cursor.execute("""
-            SELECT s.* FROM sermons s
-            JOIN sermons_fts fts ON s.id = fts.rowid
-            WHERE sermons_fts MATCH ?
-            ORDER BY rank
-            LIMIT ?
-        """, (query, limit))
+        return self._stream(
+            f"SELECT {', '.join(columns)} FROM sermons ORDER BY date DESC",
+            batch_size
+        )
+    
+    def iter_sermon_metadata(self, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Stream METADATA_COLUMNS tuples with NULLs already replaced by ''
+        (Chroma rejects None metadata values), followed by the content hash.
+        """
+        return self._stream(_SQL_ITER_METADATA, batch_size)
+    
+    def _stream(self, sql: str, batch_size: int) -> Iterator[tuple]:
+        """Run a SELECT and yield raw tuples in fetchmany batches."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.row_factory = None  # raw tuples
+            cursor.arraysize = batch_size
+            cursor.execute(sql)
         
-        rows = cursor.fetchall()
-        conn.close()
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield from rows
+    
+    def search_sermons(self, query: str, limit: int = 50) -> List[Dict]:
+        """Full-text search in sermons."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            # Ranked by bm25 (weights: title x10, description x1, theme x5)
+            cursor.execute(_SQL_SEARCH_FTS, (query, limit))
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def optimize_search_index(self):
+        """Merge FTS5 segments after writes (no-op if nothing changed)."""
+        with self._lock:
+            if not self._fts_dirty:
+                return
+            self._conn.execute("INSERT INTO sermons_fts(sermons_fts) VALUES('optimize')")
+            self._fts_dirty = False
+        logger.info("Full-text search index optimized")
+    
+    @contextmanager
+    def bulk_load_mode(self):
+        """
+        Disable the per-row FTS triggers for a large import.
+        add_sermons_bulk() writes FTS rows directly meanwhile. On exit the
+        triggers are restored, the index is rebuilt once if any other write
+        bypassed it, and then optimized.
+        """
+        with self._lock:
+            for name in _FTS_TRIGGERS:
+                self._conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            self._bulk_mode = True
+            self._fts_rebuild_needed = False
+        logger.info("Bulk load mode enabled (FTS triggers dropped)")
         
-        return [dict(row) for row in rows]
+        try:
+            yield self
+        finally:
+            with self._lock:
+                for trigger_sql in _FTS_TRIGGERS.values():
+                    self._conn.execute(trigger_sql)
+                self._bulk_mode = False
+                if self._fts_rebuild_needed:
+                    self._conn.execute("INSERT INTO sermons_fts(sermons_fts) VALUES('rebuild')")
+                    self._fts_dirty = True
+                    logger.info("FTS index rebuilt")
+            self.optimize_search_index()
+            logger.info("Bulk load mode finished (FTS triggers restored)")
+    
+    def get_vector_hashes(self) -> Dict[str, str]:
+        """Get the content hash last embedded for each message link."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("SELECT message_link, content_hash FROM vector_hashes")
+            return {link: content_hash for link, content_hash in cursor.fetchall()}
+    
+    def set_vector_hashes(self, hashes: Dict[str, str]):
+        """Record the content hashes just written to the vector store."""
+        if not hashes:
+            return
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO vector_hashes (message_link, content_hash) VALUES (?, ?)",
+                    hashes.items()
+                )
+                cursor.execute("COMMIT")
+            except Exception:
+                if self._conn.in_transaction:
+                    cursor.execute("ROLLBACK")
+                raise
+    
+    def delete_vector_hashes(self, message_links: Optional[List[str]] = None):
+        """Forget embedded hashes for the given links (all links if None)."""
+        with self._lock:
+            if message_links is None:
+                self._conn.execute("DELETE FROM vector_hashes")
+            else:
+                self._conn.executemany(
+                    "DELETE FROM vector_hashes WHERE message_link = ?",
+                    ((link,) for link in message_links)
+                )
     
     def get_sermons_by_channel(self, channel: str) -> List[Dict]:
         """Get all sermons from a specific channel."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM sermons WHERE channel = ? ORDER BY date DESC", (channel,))
-        rows = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(_SQL_GET_BY_CHANNEL, (channel,))
+            rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     
+    def get_links_for_channel(self, channel: str) -> set:
+        """Get the message links of every stored sermon from a channel."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(_SQL_GET_LINKS_BY_CHANNEL, (channel,))
+            return {row[0] for row in cursor.fetchall()}
+    
     def get_sermon_count(self) -> int:
         """Get total number of sermons in database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT COUNT(*) FROM sermons")
-        count = cursor.fetchone()[0]
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(_SQL_GET_COUNT)
+            row = cursor.fetchone()
         
-        return count
+        return row[0] if row else 0
     
     def delete_all_sermons(self):
         """Delete all sermons (admin only)."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM sermons")
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute("DELETE FROM sermons")
+            self._fts_dirty = True
+            if self._bulk_mode:
+                self._fts_rebuild_needed = True
         
-        logger.info("All sermons deleted from database")
\ No newline at end of file
+        logger.info("All sermons deleted from database")
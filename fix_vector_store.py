@@ -2,9 +2,10 @@
 Fix: Re-populate vector store from database
 """
 import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from langchain.schema import Document
-from db_handler import SermonDatabase
-from utils import rag_engine
+from db_handler import SermonDatabase, METADATA_COLUMNS
 import config
 
 logging.basicConfig(level=logging.INFO)
@@ -13,45 +14,79 @@ logger = logging.getLogger(__name__)
 print("🔧 Fixing vector store...")
 print("=" * 50)
 
-# Get all sermons from database
+# Stream sermons from database
 db = SermonDatabase(config.DB_PATH)
-sermons = db.get_all_sermons()
 
-print(f"📊 Found {len(sermons)} sermons in database")
-
-# Convert to documents with clean metadata (no None values)
+# Convert to documents with clean metadata (NULLs are coalesced in SQL)
 documents = []
-for sermon in sermons:
-    content = f"{sermon['title']}\n\n{sermon['description']}"
-    
+hashes = {}
+for *fields, content_hash in db.iter_sermon_metadata():
     doc = Document(
-        page_content=content,
-        metadata={
-            'title': sermon['title'],
-            'description': sermon['description'],
-            'channel': sermon['channel'],
-            'message_link': sermon['message_link'],
-            'image_url': sermon.get('image_url') or '',  # Replace None with empty string
-            'date': sermon.get('date') or '',
-            'theme': sermon.get('theme') or ''
-        }
+        page_content=fields[0] + "\n\n" + fields[1],
+        metadata=dict(zip(METADATA_COLUMNS, fields))
     )
     documents.append(doc)
+    hashes[doc.metadata['message_link']] = content_hash
 
+print(f"📊 Found {len(documents)} sermons in database")
 print(f"📝 Created {len(documents)} documents")
 
-# Clear existing vector store
-print("🗑️  Clearing old vector store...")
-rag_engine.clear_all()
+if not documents:
+    print("⚠️  No sermons in database - run run_ingest.py first")
+    sys.exit(0)
+
+# Import the RAG engine (Chroma + OpenAI) only once there is work to do
+from utils import get_rag_engine
+rag_engine = get_rag_engine()
+
+# Only re-embed sermons whose content changed since the last run;
+# fall back to a full rebuild if asked to, or if nothing is tracked yet
+stored_hashes = db.get_vector_hashes()
+if "--full" in sys.argv or not stored_hashes or rag_engine.count() == 0:
+    print("🗑️  Clearing old vector store...")
+    rag_engine.clear_all()
+    db.delete_vector_hashes()
+    stored_hashes = {}
+else:
+    removed = [link for link in stored_hashes if link not in hashes]
+    if removed:
+        print(f"🗑️  Removing {len(removed)} deleted sermons...")
+        rag_engine.delete_by_links(removed)
+        db.delete_vector_hashes(removed)
+
+documents = [
+    doc for doc in documents
+    if stored_hashes.get(doc.metadata['message_link']) != hashes[doc.metadata['message_link']]
+]
+print(f"🔁 {len(documents)} documents new or changed")
 
 # Add all documents
 print("➕ Adding documents to vector store...")
-# Add in batches to avoid memory issues
+# Add in batches to avoid memory issues; embed batches concurrently
+# (the OpenAI call is the bottleneck) while Chroma writes stay serialized
 batch_size = 50
-for i in range(0, len(documents), batch_size):
-    batch = documents[i:i+batch_size]
-    rag_engine.add_documents(batch)
-    print(f"   Added batch {i//batch_size + 1}/{(len(documents)-1)//batch_size + 1}")
+batches = [documents[i:i+batch_size] for i in range(0, len(documents), batch_size)]
+
+
+def embed_and_store(batch):
+    links = [doc.metadata['message_link'] for doc in batch]
+    vectors = rag_engine.embed_documents(batch)
+    
+    # Replace any older chunks for these sermons, keyed by message link
+    if stored_hashes:
+        rag_engine.delete_by_links(links)
+    if rag_engine.add_embedded_documents(batch, vectors, ids=links):
+        db.set_vector_hashes({link: hashes[link] for link in links})
+
+
+with ThreadPoolExecutor(max_workers=8) as executor:
+    futures = [executor.submit(embed_and_store, batch) for batch in batches]
+    for done, future in enumerate(as_completed(futures), 1):
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"Error embedding batch: {e}")
+        print(f"   Added batch {done}/{len(batches)}")
 
 print("\n" + "=" * 50)
 print("✅ Vector store fixed!")
@@ -3,19 +3,17 @@ Main entry point for Pastor Tara Advisor bot.
 Starts the bot and keeps it running.
 """
 import logging
+import logging.handlers
 import sys
 import os
+import random
 import time
 
 # Fix Windows console encoding FIRST
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
-from telegram import Update
-from telegram.error import TimedOut, NetworkError
-
 import config
-from telegram_bot import setup_bot
 
 # Create necessary directories
 os.makedirs('logs', exist_ok=True)
@@ -24,11 +22,21 @@ os.makedirs('cache', exist_ok=True)
 os.makedirs(config.MATERIALS_PATH, exist_ok=True)
 
 # Setup logging
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# File writes are buffered and flushed in batches (immediately on errors)
+log_file = logging.FileHandler('logs/app.log', encoding='utf-8')
+log_file.setFormatter(logging.Formatter(LOG_FORMAT))
+file_handler = logging.handlers.MemoryHandler(
+    capacity=1000,
+    flushLevel=logging.ERROR,
+    target=log_file
+)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('logs/app.log', encoding='utf-8'),
+        file_handler,
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -53,6 +61,12 @@ def main():
     
     logger.info("Configuration loaded successfully")
     
+    # Heavy imports (python-telegram-bot, LangChain, Chroma, OpenAI) are
+    # deferred until config is valid so misconfigured runs exit fast
+    from telegram import Update
+    from telegram.error import TimedOut, NetworkError
+    from telegram_bot import setup_bot
+    
     # Retry loop for network issues
     max_retries = 5
     retry_count = 0
@@ -79,8 +93,9 @@ def main():
             retry_count += 1
             logger.warning(f"Connection failed (attempt {retry_count}/{max_retries}): {e}")
             if retry_count < max_retries:
-                wait_time = retry_count * 5  # Progressive backoff
-                logger.info(f"Retrying in {wait_time} seconds...")
+                # Exponential backoff with jitter, capped at one minute
+                wait_time = min(60, 2 ** retry_count) + random.uniform(0, 1)
+                logger.info(f"Retrying in {wait_time:.1f} seconds...")
                 time.sleep(wait_time)
             else:
                 logger.error("Max retries reached. Please check your internet connection.")
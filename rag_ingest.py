@@ -9,6 +9,15 @@ from datetime import datetime
 from typing import List, Dict, Optional
 import re
 import json
+import sqlite3
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson as fast_json  # optional: faster parsing of LLM JSON replies
+except ImportError:
+    import json as fast_json
 
 from telethon import TelegramClient
 from telethon.tl.types import MessageMediaPhoto
@@ -19,21 +28,151 @@ from PyPDF2 import PdfReader
 
 import config
 from db_handler import SermonDatabase
-from utils import rag_engine, llm
+from utils import chat_model, get_db, get_rag_engine
 
 logger = logging.getLogger(__name__)
 
+# Keywords that indicate teaching
+TEACHING_KEYWORDS = (
+    'message', 'sermon', 'teaching', 'word', 'scripture', 
+    'bible', 'god', 'jesus', 'pastor', 'ministry', 'anointing',
+    'faith', 'prayer', 'worship', 'spirit', 'church', 'kingdom',
+    'testimony', 'revelation', 'prophetic', 'glory', 'grace'
+)
+
+# All teaching keywords in one pattern, so a message is scanned once in C.
+# Substring matches (no word boundaries), like the original `in` checks.
+_TEACHING_RE = re.compile('|'.join(map(re.escape, TEACHING_KEYWORDS)), re.IGNORECASE)
+
+# Fallback theme keywords, in priority order
+THEME_KEYWORDS = {
+    'faith': 'Faith',
+    'healing': 'Healing',
+    'prosperity': 'Prosperity',
+    'purpose': 'Purpose',
+    'prayer': 'Prayer',
+    'worship': 'Worship',
+    'family': 'Family',
+    'business': 'Business',
+    'breakthrough': 'Breakthrough',
+    'deliverance': 'Deliverance',
+    'grace': 'Grace',
+    'love': 'Love',
+    'power': 'Power',
+    'supernatural': 'Supernatural'
+}
+
+# Every theme keyword in one case-insensitive pattern
+_THEME_RE = re.compile('|'.join(map(re.escape, THEME_KEYWORDS)), re.IGNORECASE)
+
+# Distinct teaching keywords needed to consider a message at all, and the
+# count above which it is accepted without asking the AI
+MIN_TEACHING_KEYWORDS = 2
+CONFIDENT_TEACHING_KEYWORDS = 5
+
+# Candidate messages classified per AI validation request
+TEACHING_BATCH_SIZE = 20
+
+# Sermons whose metadata is extracted per AI request
+METADATA_BATCH_SIZE = 10
+
+# Channels scraped at the same time
+MAX_CONCURRENT_CHANNELS = 4
+
+# Documents sent to the vector store per add_documents call
+VECTOR_BATCH_SIZE = config.CHROMA_ADD_BATCH_SIZE
+
+# "3.YES" / "3. no" / "3) YES" lines in the batched validation reply
+_VERDICT_RE = re.compile(r'(\d+)\s*[.):-]?\s*(YES|NO)\b', re.IGNORECASE)
+
+# Outermost JSON object / array in an AI reply (fenced or not)
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+# Materials filename parts: "Title [link] [image.jpg].ext"
+_LINK_RE = re.compile(r'\[(https?://[^\]]+)\]')
+_IMAGE_RE = re.compile(r'\[([^\]]+\.(?:jpg|jpeg|png|gif))\]', re.IGNORECASE)
+_BRACKETS_RE = re.compile(r'[\[\]]')
+
+
+def _flush_batch(buffer: List[Document], size: int = VECTOR_BATCH_SIZE, final: bool = False):
+    """
+    Send full batches from a rolling document buffer to the vector store.
+    With final=True the remainder is flushed too.
+    """
+    while len(buffer) >= size or (final and buffer):
+        get_rag_engine().add_documents(buffer[:size])
+        del buffer[:size]
+
+
+class LLMCache:
+    """
+    Persistent key/value store for AI answers about message text.
+    Channels rarely edit old posts, so re-runs reuse earlier verdicts.
+    """
+    
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # Cached answers can be re-asked, so skip the per-commit fsync under WAL
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+    
+    @staticmethod
+    def key(kind: str, text: str) -> str:
+        """Cache key for one kind of AI question about a piece of text."""
+        return hashlib.sha256(f"{kind}:{text}".encode('utf-8')).hexdigest()
+    
+    def get_many(self, keys: List[str]) -> List[Optional[any]]:
+        """Cached answers for keys, in order, with None for each miss."""
+        if not keys:
+            return []
+        
+        placeholders = ','.join('?' * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, value FROM llm_cache WHERE key IN ({placeholders})", keys
+            ).fetchall()
+        found = dict(rows)
+        return [json.loads(found[key]) if key in found else None for key in keys]
+    
+    def set_many(self, answers: Dict[str, any]):
+        """Store several answers in one transaction."""
+        if not answers:
+            return
+        
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO llm_cache (key, value) VALUES (?, ?)",
+                    [(key, json.dumps(value)) for key, value in answers.items()]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
 
 class ChannelScraper:
     """Scrapes sermon messages from Telegram channels."""
     
-    def __init__(self):
+    def __init__(self, db: Optional[SermonDatabase] = None):
         """Initialize Telegram client for scraping."""
         self.client = None
-        self.db = SermonDatabase(config.DB_PATH)
+        self.entities = {}  # channel username -> resolved input peer
+        self.db = db or get_db()
+        self.llm_cache = LLMCache(config.LLM_CACHE_PATH)
     
     async def initialize(self):
-        """Connect to Telegram."""
+        """Connect to Telegram (once; later calls reuse the client)."""
+        if self.client is not None and self.client.is_connected():
+            return
+        
         try:
             self.client = TelegramClient(
                 'bot_session',
@@ -50,121 +189,221 @@ class ChannelScraper:
         """
         Scrape messages from a channel.
         Only extracts teaching content (ignores announcements, etc).
+        Returns the sermons saved, including partial results after an error.
         """
         logger.info(f"Scraping channel: {channel_username}")
-        sermons = []
+        saved = []
+        # Scraped sermons not yet saved, written out in full batches as they arrive
+        pending = []
         
         try:
             # Get channel entity
-            channel = await self.client.get_entity(channel_username)
+            channel = await self._get_entity(channel_username)
+            
+            # Links already stored for this channel, loaded once
+            seen = await asyncio.to_thread(self.db.get_links_for_channel, channel_username)
             
-            # Fetch messages
+            # First pass: skip known messages, then cheap keyword filter;
+            # keyword-heavy messages are accepted outright
+            candidates = []
+            validated = []
             async for message in self.client.iter_messages(channel, limit=limit):
                 # Skip empty messages
                 if not message.text:
                     continue
                 
-                # Check if it's a teaching/sermon (use AI)
-                if not await self._is_teaching(message.text):
+                if self._already_scraped(message, channel_username, seen):
                     continue
                 
-                # Extract sermon data
-                sermon_data = await self._extract_sermon_data(message, channel_username)
-                if sermon_data:
-                    sermons.append(sermon_data)
-                    
-                    # Add to database
-                    self.db.add_sermon(sermon_data)
+                keyword_count = self._keyword_count(message.text)
+                if keyword_count >= CONFIDENT_TEACHING_KEYWORDS:
+                    validated.append(message)
+                elif keyword_count >= MIN_TEACHING_KEYWORDS:
+                    candidates.append(message)
             
-            logger.info(f"Scraped {len(sermons)} sermons from {channel_username}")
-            return sermons
+            # Second pass: validate ambiguous candidates with AI, many per request
+            for i in range(0, len(candidates), TEACHING_BATCH_SIZE):
+                batch = candidates[i:i + TEACHING_BATCH_SIZE]
+                verdicts = await self._validate_teachings([m.text for m in batch])
+                validated.extend(m for m, is_teaching in zip(batch, verdicts) if is_teaching)
             
+            # Third pass: extract metadata for new sermons, many per request
+            for i in range(0, len(validated), METADATA_BATCH_SIZE):
+                batch = validated[i:i + METADATA_BATCH_SIZE]
+                metadata = await self._extract_metadata_batch([m.text for m in batch])
+                
+                for message, (title, description, theme) in zip(batch, metadata):
+                    sermon_data = self._build_sermon_data(
+                        message, channel_username, title, description, theme
+                    )
+                    pending.append(sermon_data)
+                
+                if len(pending) >= VECTOR_BATCH_SIZE:
+                    if await asyncio.to_thread(self._save_sermons, pending):
+                        saved.extend(pending)
+                    pending = []
+        
         except Exception as e:
             logger.error(f"Error scraping channel {channel_username}: {e}")
-            return []
-    
-    async def _is_teaching(self, text: str) -> bool:
-        """Use AI to determine if message is a teaching/sermon."""
-        # Quick filters first
-        if len(text) < 100:
-            return False
         
-        # Keywords that indicate teaching
-        teaching_keywords = [
-            'message', 'sermon', 'teaching', 'word', 'scripture', 
-            'bible', 'god', 'jesus', 'pastor', 'ministry', 'anointing',
-            'faith', 'prayer', 'worship', 'spirit', 'church', 'kingdom',
-            'testimony', 'revelation', 'prophetic', 'glory', 'grace'
-        ]
+        finally:
+            # Save the rest, off the event loop so other channel scrapes keep fetching
+            if await asyncio.to_thread(self._save_sermons, pending):
+                saved.extend(pending)
         
-        text_lower = text.lower()
-        keyword_count = sum(1 for keyword in teaching_keywords if keyword in text_lower)
+        logger.info(f"Scraped {len(saved)} sermons from {channel_username}")
+        return saved
+    
+    def _save_sermons(self, sermons: List[Dict]) -> bool:
+        """
+        Write sermons to the database in one transaction, then to the vector store.
+        Vectors are only added once their rows commit: a failed write leaves no
+        orphan vectors for the next scrape to add again.
+        """
+        if not sermons:
+            return True
         
-        # If it has at least 2 teaching keywords, likely a sermon
-        if keyword_count < 2:
+        if not self.db.add_sermons_bulk(sermons):
+            logger.error(f"Failed to save {len(sermons)} sermons; skipping their vectors")
             return False
         
-        # Use AI for final validation (optional - can be disabled for speed)
+        _flush_batch([self._sermon_to_document(sermon) for sermon in sermons], final=True)
+        return True
+    
+    async def _get_entity(self, channel_username: str):
+        """Resolve a channel to its input peer once and reuse it afterwards."""
+        entity = self.entities.get(channel_username)
+        if entity is None:
+            entity = await self.client.get_input_entity(channel_username)
+            self.entities[channel_username] = entity
+        return entity
+    
+    def _keyword_count(self, text: str) -> int:
+        """Count teaching keywords in a message (0 for very short messages)."""
+        # Quick filters first
+        if len(text) < 100:
+            return 0
+        
+        # Distinct keywords present, matching the per-keyword count it replaces
+        return len({match.lower() for match in _TEACHING_RE.findall(text)})
+    
+    async def _validate_teachings(self, texts: List[str]) -> List[bool]:
+        """
+        Ask the AI whether each keyword-filtered message is a sermon/teaching.
+        All uncached messages share one prompt, so N candidates cost one round-trip.
+        """
+        keys = [LLMCache.key('teaching', text[:400]) for text in texts]
+        verdicts = await asyncio.to_thread(self.llm_cache.get_many, keys)
+        missing = [i for i, verdict in enumerate(verdicts) if verdict is None]
+        if not missing:
+            return verdicts
+        
         try:
-            prompt = f"""Is this a sermon/teaching message from a pastor? Answer only YES or NO.
+            numbered = "\n\n".join(
+                f'{n}. "{texts[i][:400]}..."' for n, i in enumerate(missing, 1)
+            )
+            prompt = f"""Is each numbered message below a sermon/teaching message from a pastor?
+Answer with one line per message in the form "<number>.YES" or "<number>.NO", nothing else.
 
-Message: "{text[:400]}..."
+{numbered}
 """
-            response = llm.invoke(prompt)
-            answer = response.content.strip().upper()
-            return 'YES' in answer
+            response = await chat_model().ainvoke(prompt)
+            answers = {
+                int(num): verdict.upper() == 'YES'
+                for num, verdict in _VERDICT_RE.findall(response.content)
+            }
+            for n, i in enumerate(missing, 1):
+                verdicts[i] = answers.get(n, False)
+            await asyncio.to_thread(self.llm_cache.set_many, {
+                keys[i]: verdicts[i] for n, i in enumerate(missing, 1) if n in answers
+            })
             
         except Exception as e:
             logger.error(f"Error validating teaching: {e}")
-            # If AI fails, use keyword count
-            return keyword_count >= 2
+            # If AI fails, trust the keyword filter every candidate passed
+            for i in missing:
+                verdicts[i] = True
+        
+        return verdicts
     
-    async def _extract_sermon_data(self, message, channel_username: str) -> Optional[Dict]:
-        """Extract title, description, image, link, date, theme from message."""
-        try:
-            # Get message link
-            message_link = f"https://t.me/{channel_username.replace('@', '')}/{message.id}"
-            
-            # Check if already exists
-            existing = self.db.get_sermon_by_link(message_link)
-            if existing:
-                logger.debug(f"Sermon already exists: {message_link}")
-                return None
-            
-            # Get image URL if photo
-            image_url = None
-            if isinstance(message.media, MessageMediaPhoto):
-                # For simplicity, use the message link as image reference
-                # In production, you could download and host images
-                image_url = message_link
-            
-            # Extract title and description using AI
-            text = message.text
-            title, description, theme = await self._extract_metadata(text)
-            
-            # Format date
-            date = message.date.strftime("%Y-%m-%d") if message.date else None
-            
-            return {
-                'title': title,
-                'description': description,
-                'channel': channel_username,
-                'message_link': message_link,
-                'image_url': image_url,
-                'date': date,
-                'theme': theme
-            }
-            
-        except Exception as e:
-            logger.error(f"Error extracting sermon data: {e}")
-            return None
+    def _message_link(self, message, channel_username: str) -> str:
+        """Public t.me link for a channel message."""
+        return f"https://t.me/{channel_username.replace('@', '')}/{message.id}"
+    
+    def _already_scraped(self, message, channel_username: str, seen: Optional[set] = None) -> bool:
+        """
+        Check if this message is already stored as a sermon.
+        With a preloaded `seen` set the check is in-memory, and new links
+        are added to it so duplicates within the run are skipped too.
+        """
+        message_link = self._message_link(message, channel_username)
+        
+        if seen is None:
+            exists = self.db.get_sermon_by_link(message_link) is not None
+        else:
+            exists = message_link in seen
+            seen.add(message_link)
+        
+        if exists:
+            logger.debug(f"Sermon already exists: {message_link}")
+        return exists
+    
+    def _build_sermon_data(
+        self, message, channel_username: str, title: str, description: str, theme: str
+    ) -> Dict:
+        """Assemble the sermon record for a message from its extracted metadata."""
+        message_link = self._message_link(message, channel_username)
+        
+        # Get image URL if photo
+        image_url = None
+        if isinstance(message.media, MessageMediaPhoto):
+            # For simplicity, use the message link as image reference
+            # In production, you could download and host images
+            image_url = message_link
+        
+        # Format date
+        date = message.date.strftime("%Y-%m-%d") if message.date else None
+        
+        return {
+            'title': title,
+            'description': description,
+            'channel': channel_username,
+            'message_link': message_link,
+            'image_url': image_url,
+            'date': date,
+            'theme': theme
+        }
+    
+    @staticmethod
+    def _extract_json(content: str, pattern: re.Pattern) -> str:
+        """
+        Pull the JSON value out of an AI reply, ignoring markdown fences or
+        chatter around it. Unmatched replies are returned as-is so parsing
+        fails with a normal JSON error.
+        """
+        match = pattern.search(content)
+        return match.group(0) if match else content
+    
+    @staticmethod
+    def _clean_metadata(metadata: Dict, text: str) -> tuple:
+        """Clamp AI-extracted metadata fields to the stored lengths."""
+        return (
+            metadata.get('title', 'Untitled Sermon')[:200],
+            metadata.get('description', text[:500])[:1000],
+            metadata.get('theme', 'General')[:50]
+        )
     
     async def _extract_metadata(self, text: str) -> tuple:
         """Use AI to extract title, description, and theme from message text."""
+        # Truncate text if too long for API
+        text_sample = text[:2000] if len(text) > 2000 else text
+        
+        cache_key = LLMCache.key('metadata', text_sample)
+        cached = (await asyncio.to_thread(self.llm_cache.get_many, [cache_key]))[0]
+        if cached:
+            return tuple(cached)
+        
         try:
-            # Truncate text if too long for API
-            text_sample = text[:2000] if len(text) > 2000 else text
-            
             prompt = f"""Extract metadata from this sermon message:
 
 Message: "{text_sample}"
@@ -179,27 +418,13 @@ Return ONLY the JSON object, nothing else.
 Example:
 {{"title": "Walking in Faith During Difficult Times", "description": "Pastor Tara teaches about maintaining faith when facing challenges...", "theme": "Faith"}}
 """
-            response = llm.invoke(prompt)
-            content = response.content.strip()
-            
-            # Parse JSON
-            # Remove markdown code blocks if present
-            if content.startswith('```'):
-                content = content.split('```')[1]
-                if content.startswith('json'):
-                    content = content[4:]
-                content = content.strip()
+            response = await chat_model().ainvoke(prompt)
+            content = self._extract_json(response.content, _JSON_OBJ_RE)
             
-            # Remove any trailing backticks
-            content = content.rstrip('`').strip()
-            
-            metadata = json.loads(content)
-            
-            return (
-                metadata.get('title', 'Untitled Sermon')[:200],
-                metadata.get('description', text[:500])[:1000],
-                metadata.get('theme', 'General')[:50]
-            )
+            metadata = fast_json.loads(content)
+            result = self._clean_metadata(metadata, text)
+            await asyncio.to_thread(self.llm_cache.set_many, {cache_key: result})
+            return result
             
         except json.JSONDecodeError as e:
             logger.error(f"JSON parsing error in metadata extraction: {e}")
@@ -210,6 +435,60 @@ Example:
             logger.error(f"Error extracting metadata with AI: {e}")
             return self._fallback_extract_metadata(text)
     
+    async def _extract_metadata_batch(self, texts: List[str]) -> List[tuple]:
+        """
+        Extract (title, description, theme) for several sermons in one AI call.
+        Items missing from the reply, or a reply that fails to parse, fall
+        back to the single-message extractor.
+        """
+        keys = [LLMCache.key('metadata', text[:2000]) for text in texts]
+        cached = await asyncio.to_thread(self.llm_cache.get_many, keys)
+        results: List[Optional[tuple]] = [tuple(answer) if answer else None for answer in cached]
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+        
+        try:
+            payload = json.dumps(
+                {'sermons': [{'id': i, 'text': texts[i][:2000]} for i in missing]},
+                ensure_ascii=False
+            )
+            prompt = f"""Extract metadata from each sermon message in this JSON input:
+
+{payload}
+
+Return a JSON array with one object per sermon:
+- "id": The sermon's id from the input
+- "title": A clear, concise title (5-15 words max)
+- "description": A full description of the sermon content (30-200 words)
+- "theme": Main theme/topic (1-3 words like "Faith", "Healing", "Purpose")
+
+Return ONLY the JSON array, nothing else.
+
+Example:
+[{{"id": 0, "title": "Walking in Faith During Difficult Times", "description": "Pastor Tara teaches about maintaining faith when facing challenges...", "theme": "Faith"}}]
+"""
+            response = await chat_model().ainvoke(prompt)
+            content = self._extract_json(response.content, _JSON_ARRAY_RE)
+            
+            answers = {}
+            for item in fast_json.loads(content):
+                idx = item.get('id')
+                if idx in missing and results[idx] is None:
+                    results[idx] = self._clean_metadata(item, texts[idx])
+                    answers[keys[idx]] = results[idx]
+            await asyncio.to_thread(self.llm_cache.set_many, answers)
+            
+        except Exception as e:
+            logger.error(f"Error extracting batched metadata with AI: {e}")
+        
+        for i, text in enumerate(texts):
+            if results[i] is None:
+                results[i] = await self._extract_metadata(text)
+        
+        return results
+    
     def _fallback_extract_metadata(self, text: str) -> tuple:
         """Fallback method to extract metadata without AI."""
         lines = text.split('\n')
@@ -228,30 +507,12 @@ Example:
         # Description: Use first 500 chars
         description = text[:500].replace('\n', ' ').strip()
         
-        # Theme: Extract from common patterns
-        theme = "General"
-        theme_keywords = {
-            'faith': 'Faith',
-            'healing': 'Healing',
-            'prosperity': 'Prosperity',
-            'purpose': 'Purpose',
-            'prayer': 'Prayer',
-            'worship': 'Worship',
-            'family': 'Family',
-            'business': 'Business',
-            'breakthrough': 'Breakthrough',
-            'deliverance': 'Deliverance',
-            'grace': 'Grace',
-            'love': 'Love',
-            'power': 'Power',
-            'supernatural': 'Supernatural'
-        }
-        
-        text_lower = text.lower()
-        for keyword, theme_name in theme_keywords.items():
-            if keyword in text_lower:
-                theme = theme_name
-                break
+        # Theme: earliest-listed theme keyword found in one regex pass
+        found = {m.group(0).lower() for m in _THEME_RE.finditer(text)}
+        theme = next(
+            (name for keyword, name in THEME_KEYWORDS.items() if keyword in found),
+            "General"
+        )
         
         return (title, description, theme)
     
@@ -260,54 +521,55 @@ Example:
         await self.initialize()
         
         all_sermons = []
-        for channel in config.CHANNELS_TO_SCRAPE:
-            try:
-                sermons = await self.scrape_channel(channel)
-                all_sermons.extend(sermons)
-            except Exception as e:
-                logger.error(f"Failed to scrape {channel}: {e}")
-                continue
+        # Scrape channels concurrently, capped to limit Telegram flood-waits
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHANNELS)
+        
+        async def scrape_limited(channel: str) -> List[Dict]:
+            async with semaphore:
+                return await self.scrape_channel(channel)
         
-        # Add to vector store
-        if all_sermons:
-            documents = self._sermons_to_documents(all_sermons)
-            rag_engine.add_documents(documents)
+        # FTS triggers are off; bulk writes update the index directly
+        with self.db.bulk_load_mode():
+            results = await asyncio.gather(
+                *[scrape_limited(channel) for channel in config.CHANNELS_TO_SCRAPE],
+                return_exceptions=True
+            )
+        
+        for channel, result in zip(config.CHANNELS_TO_SCRAPE, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to scrape {channel}: {result}")
+                continue
+            all_sermons.extend(result)
         
         await self.client.disconnect()
         
         logger.info(f"Total sermons scraped: {len(all_sermons)}")
         return all_sermons
     
-    def _sermons_to_documents(self, sermons: List[Dict]) -> List[Document]:
-        """Convert sermons to LangChain documents for vector store."""
-        documents = []
+    def _sermon_to_document(self, sermon: Dict) -> Document:
+        """Convert a sermon to a LangChain document for the vector store."""
+        # Combine title and description for embedding
+        content = f"{sermon['title']}\n\n{sermon['description']}"
         
-        for sermon in sermons:
-            # Combine title and description for embedding
-            content = f"{sermon['title']}\n\n{sermon['description']}"
-            
-            doc = Document(
-                page_content=content,
-                metadata={
-                    'title': sermon['title'],
-                    'description': sermon['description'],
-                    'channel': sermon['channel'],
-                    'message_link': sermon['message_link'],
-                    'image_url': sermon.get('image_url'),
-                    'date': sermon.get('date'),
-                    'theme': sermon.get('theme', '')
-                }
-            )
-            documents.append(doc)
-        
-        return documents
+        return Document(
+            page_content=content,
+            metadata={
+                'title': sermon['title'],
+                'description': sermon['description'],
+                'channel': sermon['channel'],
+                'message_link': sermon['message_link'],
+                'image_url': sermon.get('image_url'),
+                'date': sermon.get('date'),
+                'theme': sermon.get('theme', '')
+            }
+        )
 
 
 class MaterialsLoader:
     """Loads documents from materials folder."""
     
-    def __init__(self):
-        self.db = SermonDatabase(config.DB_PATH)
+    def __init__(self, db: Optional[SermonDatabase] = None):
+        self.db = db or get_db()
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=1000,
             chunk_overlap=200
@@ -329,68 +591,97 @@ class MaterialsLoader:
         
         logger.info(f"Loading {len(files)} files from materials folder")
         
-        all_documents = []
-        for filename in files:
-            filepath = os.path.join(config.MATERIALS_PATH, filename)
-            
+        # Parse files in parallel (PDF/DOCX parsing is I/O and C-extension heavy)
+        # Chunks are embedded in batches as files finish, bounding peak memory
+        buffer = []
+        all_sermons = []
+        loaded_files = []
+        total_documents = 0
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            for filename, result in zip(files, executor.map(self._load_file, files)):
+                if result:
+                    sermon_data, docs = result
+                    all_sermons.append(sermon_data)
+                    loaded_files.append(filename)
+                    buffer.extend(docs)
+                    total_documents += len(docs)
+                    _flush_batch(buffer)
+        _flush_batch(buffer, final=True)
+        
+        # Save all sermon entries in one transaction
+        if all_sermons and not self.db.add_sermons_bulk(all_sermons):
+            logger.error(f"Failed to save {len(all_sermons)} materials; keeping files for the next run")
+            return
+        self.db.optimize_search_index()
+        
+        # Delete files only once their sermon entries are committed
+        for filename in loaded_files:
             try:
-                # Load file based on extension
-                if filename.endswith('.txt'):
-                    content = self._load_txt(filepath)
-                elif filename.endswith('.docx'):
-                    content = self._load_docx(filepath)
-                elif filename.endswith('.pdf'):
-                    content = self._load_pdf(filepath)
-                else:
-                    continue
-                
-                if not content or len(content.strip()) < 50:
-                    logger.warning(f"Skipping empty or too short file: {filename}")
-                    os.remove(filepath)
-                    continue
-                
-                # Extract metadata from filename or content
-                title, link, image = self._parse_filename(filename)
-                
-                # Create sermon entry
-                sermon_data = {
+                os.remove(os.path.join(config.MATERIALS_PATH, filename))
+                logger.info(f"Loaded and deleted: {filename}")
+            except OSError as e:
+                logger.error(f"Error deleting {filename}: {e}")
+        
+        if total_documents:
+            logger.info(f"Added {total_documents} documents to vector store from materials")
+    
+    def _load_file(self, filename: str) -> Optional[tuple]:
+        """
+        Load one materials file into a sermon entry and vector-store chunks.
+        Returns (sermon_data, documents), or None if the file was skipped.
+        The caller deletes the file once its sermon entry is saved.
+        """
+        filepath = os.path.join(config.MATERIALS_PATH, filename)
+        
+        try:
+            # Load file based on extension
+            if filename.endswith('.txt'):
+                content = self._load_txt(filepath)
+            elif filename.endswith('.docx'):
+                content = self._load_docx(filepath)
+            elif filename.endswith('.pdf'):
+                content = self._load_pdf(filepath)
+            else:
+                return None
+            
+            if not content or len(content.strip()) < 50:
+                logger.warning(f"Skipping empty or too short file: {filename}")
+                os.remove(filepath)
+                return None
+            
+            # Extract metadata from filename or content
+            title, link, image = self._parse_filename(filename)
+            
+            # Create sermon entry
+            sermon_data = {
+                'title': title,
+                'description': content[:500],
+                'channel': 'materials',
+                'message_link': link or f"materials/{filename}",
+                'image_url': image,
+                'date': datetime.now().strftime("%Y-%m-%d"),
+                'theme': 'General'
+            }
+            
+            # Create documents for vector store
+            docs = self.text_splitter.create_documents(
+                [content],
+                metadatas=[{
                     'title': title,
                     'description': content[:500],
                     'channel': 'materials',
-                    'message_link': link or f"materials/{filename}",
+                    'message_link': sermon_data['message_link'],
                     'image_url': image,
-                    'date': datetime.now().strftime("%Y-%m-%d"),
+                    'date': sermon_data['date'],
                     'theme': 'General'
-                }
-                
-                self.db.add_sermon(sermon_data)
-                
-                # Create documents for vector store
-                docs = self.text_splitter.create_documents(
-                    [content],
-                    metadatas=[{
-                        'title': title,
-                        'description': content[:500],
-                        'channel': 'materials',
-                        'message_link': sermon_data['message_link'],
-                        'image_url': image,
-                        'date': sermon_data['date'],
-                        'theme': 'General'
-                    }]
-                )
-                all_documents.extend(docs)
-                
-                # Delete file after loading
-                os.remove(filepath)
-                logger.info(f"Loaded and deleted: {filename}")
-                
-            except Exception as e:
-                logger.error(f"Error loading {filename}: {e}")
-        
-        # Add to vector store
-        if all_documents:
-            rag_engine.add_documents(all_documents)
-            logger.info(f"Added {len(all_documents)} documents to vector store from materials")
+                }]
+            )
+            
+            return sermon_data, docs
+            
+        except Exception as e:
+            logger.error(f"Error loading {filename}: {e}")
+            return None
     
     def _load_txt(self, filepath: str) -> str:
         """Load text file."""
@@ -415,12 +706,11 @@ class MaterialsLoader:
         """Load PDF file."""
         try:
             reader = PdfReader(filepath)
-            text = []
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text.append(page_text)
-            return '\n'.join(text)
+            # Stream page text straight into a single join
+            return '\n'.join(
+                page_text for page_text in (page.extract_text() for page in reader.pages)
+                if page_text
+            )
         except Exception as e:
             logger.error(f"Error loading PDF {filepath}: {e}")
             return ""
@@ -435,20 +725,20 @@ class MaterialsLoader:
         
         # Extract link (URL in square brackets)
         link = None
-        link_match = re.search(r'\[(https?://[^\]]+)\]', name)
+        link_match = _LINK_RE.search(name)
         if link_match:
             link = link_match.group(1)
             name = name.replace(link_match.group(0), '').strip()
         
         # Extract image (filename with image extension in square brackets)
         image = None
-        image_match = re.search(r'\[([^\]]+\.(jpg|jpeg|png|gif))\]', name, re.IGNORECASE)
+        image_match = _IMAGE_RE.search(name)
         if image_match:
             image = image_match.group(1)
             name = name.replace(image_match.group(0), '').strip()
         
         # Clean up remaining brackets
-        name = re.sub(r'\[|\]', '', name).strip()
+        name = _BRACKETS_RE.sub('', name).strip()
         
         # Remaining is title
         title = name if name else "Untitled Sermon"
@@ -7,11 +7,13 @@ Usage: python run_ingest.py
 """
 import asyncio
 import logging
+import logging.handlers
 import sys
 import os
 
 import config
 from rag_ingest import ChannelScraper, MaterialsLoader
+from utils import get_db
 
 # Create necessary directories
 os.makedirs('logs', exist_ok=True)
@@ -20,11 +22,21 @@ os.makedirs('cache', exist_ok=True)
 os.makedirs(config.MATERIALS_PATH, exist_ok=True)
 
 # Setup logging
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# File writes are buffered and flushed in batches (immediately on errors)
+log_file = logging.FileHandler('logs/ingest.log')
+log_file.setFormatter(logging.Formatter(LOG_FORMAT))
+file_handler = logging.handlers.MemoryHandler(
+    capacity=1000,
+    flushLevel=logging.ERROR,
+    target=log_file
+)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('logs/ingest.log'),
+        file_handler,
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -47,13 +59,12 @@ async def main():
         # Step 2: Load materials from folder
         print("\n📁 Loading materials from folder...")
         loader = MaterialsLoader()
-        loader.load_all_materials()
+        # File parsing and SQLite writes are blocking; keep them off the loop
+        await asyncio.to_thread(loader.load_all_materials)
         print("✅ Materials loaded successfully")
         
         # Summary
-        from db_handler import SermonDatabase
-        db = SermonDatabase(config.DB_PATH)
-        total_count = db.get_sermon_count()
+        total_count = get_db().get_sermon_count()
         
         print("\n" + "=" * 50)
         print(f"🎉 All files loaded!")
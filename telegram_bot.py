@@ -2,12 +2,16 @@
 Telegram bot handler for Pastor Tara Advisor.
 Handles all user interactions, commands, and conversations.
 """
+import asyncio
 import logging
 import os
-from typing import Dict, List
+import functools
+import re
+from typing import Dict, List, Optional
 import hashlib
 
 from telegram import Update, InputFile
+from telegram.error import RetryAfter
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -19,22 +23,45 @@ from telegram.ext import (
 import config
 from db_handler import SermonDatabase
 from utils import (
-    rag_engine,
-    recommendation_engine,
-    response_generator,
-    CacheManager
+    get_db,
+    get_rag_engine,
+    get_recommendation_engine,
+    get_response_generator,
+    CacheManager,
+    TTLCache
 )
 
 logger = logging.getLogger(__name__)
 
+# Sermon caption, filled per sermon with format_map
+_CAPTION_TPL = "*{title}*\n\n{description}\n\n✨ _Listen. Share. Be Transformed._ ✨\n\n🔗 {link}"
+
+# Characters Telegram's legacy Markdown treats as entity markers (escaped in
+# plain text; legacy Markdown has no escapes inside an entity like *bold*)
+_MD_ESCAPE = re.compile(r'([_*`\[])')
+
 
 class PastorTaraBot:
     """Main bot class handling all interactions."""
     
-    def __init__(self):
-        self.db = SermonDatabase(config.DB_PATH)
+    def __init__(self, db: Optional[SermonDatabase] = None):
+        self.db = db or get_db()
         self.cache = CacheManager()
-        self.user_sessions = {}  # Store ranked sermons for "more" command
+        # Ranked sermon links per user for the "more" command (sermons are
+        # reloaded from the DB); sessions expire 30 minutes after the last
+        # search or "more", so memory stays bounded
+        self.user_sessions = TTLCache(maxsize=10_000, ttl=1800)
+        
+        # Repeat messages skip intent parsing and the embedding + vector search
+        self._extract_intent = functools.lru_cache(maxsize=1024)(
+            get_response_generator().extract_intent
+        )
+        self.search_cache = TTLCache(maxsize=1024, ttl=3600)
+        
+        # Open Chroma and load the reranker now, before polling starts, so the
+        # first user message doesn't block the event loop on that setup
+        get_rag_engine()
+        get_recommendation_engine()
     
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command with warm welcome."""
@@ -133,7 +160,7 @@ God bless you! 🙏✨"""
             return
         
         # Extract intent
-        intent = response_generator.extract_intent(message_text)
+        intent = self._extract_intent(message_text)
         topic = intent['topic']
         num = intent['num_requested']
         
@@ -154,7 +181,7 @@ God bless you! 🙏✨"""
             
             # Step 1: Search with RAG
             logger.info(f"User {user_id} searching for: {topic}")
-            search_results = rag_engine.search(topic, k=config.TOP_K_SEARCH)
+            search_results = await self._search(topic, config.TOP_K_SEARCH)
             
             if not search_results:
                 await update.message.reply_text(
@@ -163,14 +190,22 @@ God bless you! 🙏✨"""
                 )
                 return
             
-            # Step 2: Rank with AI
-            ranked_sermons = recommendation_engine.rank_sermons(
-                topic, 
-                search_results, 
-                user_id
+            # Step 2: Rank, while the AI writes the reply (warm message + verse
+            # + encouragement) - the reply doesn't depend on the ranking
+            reply_task = asyncio.create_task(
+                get_response_generator().generate_response(topic, search_results, num)
             )
+            try:
+                ranked_sermons = await get_recommendation_engine().rank_sermons(
+                    topic, search_results, user_id
+                )
+            except BaseException:
+                reply_task.cancel()
+                raise
             
             if not ranked_sermons:
+                # No reply is sent without sermons; stop paying for it
+                reply_task.cancel()
                 await update.message.reply_text(
                     "🤔 I couldn't find highly relevant sermons for that. "
                     "Try rephrasing your request! 💭"
@@ -178,13 +213,14 @@ God bless you! 🙏✨"""
                 return
             
             # Store for "more" command
-            self.user_sessions[user_id] = {
-                'sermons': ranked_sermons,
+            session = {
+                'links': [sermon['message_link'] for sermon in ranked_sermons],
                 'index': 0
             }
+            self.user_sessions[user_id] = session
             
-            # Step 3: Generate AI response (warm message + verse + encouragement)
-            ai_response = response_generator.generate_response(topic, ranked_sermons, num)
+            # Step 3: Send the AI response
+            ai_response = await reply_task
             await update.message.reply_text(ai_response, parse_mode='Markdown')
             
             # Step 4: Send sermon recommendations as photo messages
@@ -195,7 +231,7 @@ God bless you! 🙏✨"""
             )
             
             # Update index
-            self.user_sessions[user_id]['index'] = num
+            session['index'] = num
             
             # Suggest "more" if more sermons available
             if len(ranked_sermons) > num:
@@ -209,68 +245,96 @@ God bless you! 🙏✨"""
                 "🙏 Sorry, I encountered an error. Please try again!"
             )
     
+    async def _search(self, topic: str, k: int) -> List[Dict]:
+        """RAG search, cached per normalized topic for an hour."""
+        key = (topic.lower().strip(), k)
+        results = self.search_cache.get(key)
+        if results is None:
+            # Embedding request and vector query block; keep them off the loop
+            results = await asyncio.to_thread(get_rag_engine().search, topic, k)
+            if results:
+                self.search_cache[key] = results
+        return results
+    
     async def _send_sermon_recommendations(
         self, 
         update: Update, 
         sermons: List[Dict],
         user_id: int
     ):
-        """Send each sermon as a separate photo message."""
+        """
+        Send each sermon as a separate photo message, in ranked order.
+        One at a time: Telegram shows messages in the order they arrive, and a
+        burst of sends into one chat runs into flood control.
+        """
         for sermon in sermons:
+            await self._send_one(update, sermon, user_id)
+    
+    async def _send_one(self, update: Update, sermon: Dict, user_id: int):
+        """Send a single sermon, waiting out a flood-control limit once."""
+        try:
             try:
-                # Format caption
-                caption = self._format_sermon_caption(sermon)
-                
-                # Send as photo if image available, otherwise as text
-                if sermon.get('image_url'):
-                    try:
-                        await update.message.reply_photo(
-                            photo=sermon['image_url'],
-                            caption=caption,
-                            parse_mode='Markdown'
-                        )
-                    except Exception:
-                        # Fallback to text if image fails
-                        await update.message.reply_text(caption, parse_mode='Markdown')
-                else:
-                    # No image, send as text with emoji
-                    await update.message.reply_text(f"🎧 {caption}", parse_mode='Markdown')
-                
-                logger.info(f"Sent sermon to user {user_id}: {sermon['title']}")
-                
-            except Exception as e:
-                logger.error(f"Error sending sermon: {e}")
+                await self._reply_sermon(update, sermon)
+            except RetryAfter as e:
+                logger.warning(f"Flood control for user {user_id}; retrying in {e.retry_after}s")
+                await asyncio.sleep(e.retry_after)
+                await self._reply_sermon(update, sermon)
+            
+            logger.info(f"Sent sermon to user {user_id}: {sermon['title']}")
+            
+        except Exception as e:
+            logger.error(f"Error sending sermon: {e}")
+    
+    async def _reply_sermon(self, update: Update, sermon: Dict):
+        """Send a sermon as a photo, falling back to text."""
+        # Format caption
+        caption = self._format_sermon_caption(sermon)
+        
+        # Send as photo if image available, otherwise as text
+        if sermon.get('image_url'):
+            try:
+                await update.message.reply_photo(
+                    photo=sermon['image_url'],
+                    caption=caption,
+                    parse_mode='Markdown'
+                )
+            except RetryAfter:
+                raise
+            except Exception:
+                # Fallback to text if image fails
+                await update.message.reply_text(caption, parse_mode='Markdown')
+        else:
+            # No image, send as text with emoji
+            await update.message.reply_text(f"🎧 {caption}", parse_mode='Markdown')
     
     def _format_sermon_caption(self, sermon: Dict) -> str:
         """Format sermon data into a beautiful caption."""
-        title = sermon.get('title', 'Untitled')
-        description = sermon.get('description', 'No description available')
-        link = sermon.get('message_link', '')
-        
-        caption = f"""*{title}*
-
-{description}
-
-✨ _Listen. Share. Be Transformed._ ✨
-
-🔗 {link}"""
-        
-        return caption
+        return _CAPTION_TPL.format_map({
+            # Inside *bold* only a '*' would end the entity early; drop it and
+            # leave '_', '`' and '[' as the literal characters they are there
+            'title': (sermon.get('title') or 'Untitled').replace('*', ''),
+            'description': _MD_ESCAPE.sub(
+                r'\\\1', sermon.get('description') or 'No description available'
+            ),
+            'link': _MD_ESCAPE.sub(r'\\\1', sermon.get('message_link') or ''),
+        })
     
     async def _handle_more(self, update: Update, user_id: int):
         """Handle 'more' requests to get next batch of sermons."""
-        if user_id not in self.user_sessions:
+        session = self.user_sessions.get(user_id)
+        if session is None:
             await update.message.reply_text(
                 "🤔 Please search for sermons first before asking for more!"
             )
             return
         
-        session = self.user_sessions[user_id]
-        sermons = session['sermons']
+        links = session['links']
         current_index = session['index']
         
         # Get next 5 sermons
-        next_batch = sermons[current_index:current_index + 5]
+        next_batch = await asyncio.to_thread(
+            self.db.get_sermons_by_links, links[current_index:current_index + 5]
+        )
         
         if not next_batch:
             await update.message.reply_text(
@@ -283,11 +347,12 @@ God bless you! 🙏✨"""
         await update.message.reply_text("🎧 Here are more sermons for you:")
         await self._send_sermon_recommendations(update, next_batch, user_id)
         
-        # Update index
+        # Update index; re-set so the session's TTL counts from this request
         session['index'] = current_index + 5
+        self.user_sessions[user_id] = session
         
         # Check if more available
-        if session['index'] < len(sermons):
+        if session['index'] < len(links):
             await update.message.reply_text(
                 "💡 Still more available! Say 'more' again. ✨"
             )
@@ -308,8 +373,15 @@ God bless you! 🙏✨"""
 
 def setup_bot() -> Application:
     """Setup and configure the bot."""
-    # Create application
-    application = Application.builder().token(config.TELEGRAM_TOKEN).build()
+    # Create application with a connection pool large enough that concurrent
+    # replies and reconnects don't queue on a single HTTP connection
+    application = (
+        Application.builder()
+        .token(config.TELEGRAM_TOKEN)
+        .connection_pool_size(16)
+        .get_updates_connection_pool_size(2)
+        .build()
+    )
     
     # Initialize bot handler
     bot = PastorTaraBot()
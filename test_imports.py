@@ -1,77 +1,47 @@
 """
 Test if all imports work correctly
 """
-import sys
+import importlib
+
+# (module, comma-separated attributes it must provide)
+TARGETS = [
+    ("os", ""),
+    ("asyncio", ""),
+    ("logging", ""),
+    ("dotenv", "load_dotenv"),
+    ("config", ""),
+    ("db_handler", "SermonDatabase"),
+    ("utils", "get_rag_engine"),
+    ("rag_ingest", "ChannelScraper, MaterialsLoader"),
+    ("telethon", "TelegramClient"),
+    ("langchain_openai", "OpenAIEmbeddings, ChatOpenAI"),
+    ("chromadb", ""),
+]
+
+
+def try_import(name: str, attrs: str):
+    """Import a module and check its attributes; return it, or None on failure."""
+    try:
+        module = importlib.import_module(name)
+        for attr in filter(None, (a.strip() for a in attrs.split(","))):
+            getattr(module, attr)
+        print(f"✅ {name}")
+        return module
+    except Exception as e:
+        print(f"❌ {name}: {e}")
+        return None
 
-print("Testing imports...")
-
-try:
-    import os
-    print("✅ os")
-except Exception as e:
-    print(f"❌ os: {e}")
-
-try:
-    import asyncio
-    print("✅ asyncio")
-except Exception as e:
-    print(f"❌ asyncio: {e}")
-
-try:
-    import logging
-    print("✅ logging")
-except Exception as e:
-    print(f"❌ logging: {e}")
-
-try:
-    from dotenv import load_dotenv
-    print("✅ dotenv")
-except Exception as e:
-    print(f"❌ dotenv: {e}")
 
-try:
-    import config
-    print("✅ config")
-    print(f"   - TELEGRAM_TOKEN: {'SET' if config.TELEGRAM_TOKEN else 'NOT SET'}")
-    print(f"   - OPENAI_API_KEY: {'SET' if config.OPENAI_API_KEY else 'NOT SET'}")
-    print(f"   - TELEGRAM_API_ID: {'SET' if config.TELEGRAM_API_ID else 'NOT SET'}")
-except Exception as e:
-    print(f"❌ config: {e}")
-
-try:
-    from db_handler import SermonDatabase
-    print("✅ db_handler")
-except Exception as e:
-    print(f"❌ db_handler: {e}")
-
-try:
-    from utils import rag_engine
-    print("✅ utils")
-except Exception as e:
-    print(f"❌ utils: {e}")
-
-try:
-    from rag_ingest import ChannelScraper, MaterialsLoader
-    print("✅ rag_ingest")
-except Exception as e:
-    print(f"❌ rag_ingest: {e}")
-
-try:
-    from telethon import TelegramClient
-    print("✅ telethon")
-except Exception as e:
-    print(f"❌ telethon: {e}")
+print("Testing imports...")
 
-try:
-    from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-    print("✅ langchain_openai")
-except Exception as e:
-    print(f"❌ langchain_openai: {e}")
+failed = False
+for name, attrs in TARGETS:
+    module = try_import(name, attrs)
+    failed |= module is None
 
-try:
-    from langchain_chroma import Chroma
-    print("✅ langchain_chroma")
-except Exception as e:
-    print(f"❌ langchain_chroma: {e}")
+    if name == "config" and module is not None:
+        print(f"   - TELEGRAM_TOKEN: {'SET' if module.TELEGRAM_TOKEN else 'NOT SET'}")
+        print(f"   - OPENAI_API_KEY: {'SET' if module.OPENAI_API_KEY else 'NOT SET'}")
+        print(f"   - TELEGRAM_API_ID: {'SET' if module.TELEGRAM_API_ID else 'NOT SET'}")
 
-print("\n✅ All imports successful!" if all else "\n⚠️ Some imports failed")
\ No newline at end of file
+print("\n⚠️ Some imports failed" if failed else "\n✅ All imports successful!")
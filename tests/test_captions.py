@@ -0,0 +1,56 @@
+"""
+Tests for sermon caption formatting (Telegram legacy Markdown).
+Run with: python -m unittest discover tests
+"""
+import importlib.util
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# telegram_bot pulls in the bot, OpenAI and Chroma stacks at import time
+REQUIRED = ("telegram", "dotenv", "langchain_openai", "chromadb")
+MISSING = [name for name in REQUIRED if importlib.util.find_spec(name) is None]
+
+
+@unittest.skipIf(MISSING, f"missing dependencies: {', '.join(MISSING)}")
+class FormatSermonCaptionTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("OPENAI_API_KEY", "test-key")
+        from telegram_bot import PastorTaraBot
+        # The formatter uses no instance state; skip __init__ (DB, Chroma, reranker)
+        cls.bot = object.__new__(PastorTaraBot)
+
+    def caption(self, **sermon):
+        return self.bot._format_sermon_caption(sermon)
+
+    def test_title_keeps_underscores_and_drops_asterisks(self):
+        caption = self.caption(
+            title="Walking_in *Faith*",
+            description="desc",
+            message_link="https://t.me/c/1"
+        )
+        first_line = caption.split("\n", 1)[0]
+        self.assertEqual(first_line, "*Walking_in Faith*")
+        self.assertNotIn("\\", first_line)
+
+    def test_description_and_link_are_escaped(self):
+        caption = self.caption(
+            title="Grace",
+            description="be *bold* and [kind]",
+            message_link="https://t.me/pastor_tara/12"
+        )
+        self.assertIn("be \\*bold\\* and \\[kind]", caption)
+        self.assertIn("https://t.me/pastor\\_tara/12", caption)
+
+    def test_missing_fields_use_defaults(self):
+        caption = self.caption()
+        self.assertTrue(caption.startswith("*Untitled*\n"))
+        self.assertIn("No description available", caption)
+
+
+if __name__ == "__main__":
+    unittest.main()
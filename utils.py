@@ -3,33 +3,119 @@ Utility functions for AI interactions, RAG search, and recommendation ranking.
 This is the brain of the bot - handles intelligent sermon recommendations.
 """
 import os
+import asyncio
 import json
+import re
 import logging
-from datetime import datetime, timedelta
+import functools
+import time
+from collections import OrderedDict
 from typing import List, Dict, Optional
 import hashlib
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import orjson as fast_json  # optional: faster cache (de)serialization
+except ImportError:
+    import json as fast_json
+
+try:
+    import xxhash  # optional: faster non-cryptographic cache keys
+except ImportError:
+    xxhash = None
+
+import httpx
+import numpy as np
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain_chroma import Chroma
+import chromadb
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
 
 import config
+from db_handler import SermonDatabase
 
 logger = logging.getLogger(__name__)
 
+# Number of recommendations asked for in a message: a standalone 1-3 digit
+# number, but not part of a verse reference like "John 3:16"
+_NUM_RE = re.compile(r"(?<![\w:])(\d{1,3})(?![\w:])")
+
+# Embedding requests in flight at once when adding documents
+EMBED_WORKERS = 4
+
 # Set OpenAI API key as environment variable (required for langchain-openai 0.2.0)
 os.environ["OPENAI_API_KEY"] = config.OPENAI_API_KEY
 
+# Pooled keep-alive HTTP client shared by every sync OpenAI call, so repeat
+# requests skip the TCP/TLS handshake
+_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60)
+http_client = httpx.Client(limits=_HTTP_LIMITS)
+
 # Initialize AI components without passing api_key directly
+# (embeddings are only called synchronously, from worker threads)
 embeddings = OpenAIEmbeddings(
-    model=config.EMBEDDING_MODEL
+    model=config.EMBEDDING_MODEL,
+    http_client=http_client
 )
 
-llm = ChatOpenAI(
-    model=config.AI_MODEL,
-    temperature=0.7
-)
+# Async connections belong to the event loop that opened them, and polling
+# restarts (main.py) and each asyncio.run in rag_ingest start a fresh loop,
+# so chat clients and their async pool are rebuilt per running loop
+_chat_lock = threading.Lock()
+_chat_loop: Optional[asyncio.AbstractEventLoop] = None
+_chat_http_client: Optional[httpx.AsyncClient] = None
+_chat_models: Dict[tuple, ChatOpenAI] = {}
+
+
+def chat_model(model: str = config.AI_MODEL, temperature: float = 0.7) -> ChatOpenAI:
+    """
+    One ChatOpenAI client per (model, temperature) for the running event loop,
+    on the shared sync pool and a keep-alive async pool owned by that loop.
+    """
+    global _chat_loop, _chat_http_client
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    
+    with _chat_lock:
+        if loop is not None and loop is not _chat_loop:
+            # The previous loop's pooled connections are unusable from this one
+            _chat_loop = loop
+            _chat_http_client = httpx.AsyncClient(limits=_HTTP_LIMITS)
+            _chat_models.clear()
+        
+        key = (model, temperature)
+        if key not in _chat_models:
+            _chat_models[key] = ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                http_client=http_client,
+                http_async_client=_chat_http_client
+            )
+        return _chat_models[key]
+
+
+def cache_digest(text: str) -> str:
+    """Short hex digest for cache keys (not security-sensitive)."""
+    data = text.encode()
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+@functools.lru_cache(maxsize=1024)
+def embed_query(query: str) -> np.ndarray:
+    """
+    Query embedding as a read-only float32 vector, cached by query text so
+    repeated queries (search, then ranking) cost one API call.
+    """
+    vector = np.asarray(embeddings.embed_query(query), dtype=np.float32)
+    vector.setflags(write=False)
+    return vector
 
 
 class RAGEngine:
@@ -39,23 +125,99 @@ class RAGEngine:
         """Initialize Chroma vector store."""
         os.makedirs(config.CHROMA_PATH, exist_ok=True)
         
-        self.vectorstore = Chroma(
-            persist_directory=config.CHROMA_PATH,
-            embedding_function=embeddings,
-            collection_name="sermons"
-        )
+        self.client = chromadb.PersistentClient(path=config.CHROMA_PATH)
+        self.collection = self._get_collection()
+        # Chroma writes are not thread-safe; embedding calls can run in parallel
+        self._write_lock = threading.Lock()
+        # Recent search results, keyed by query text and embedding
+        self.cache = SemanticCache()
         logger.info("RAG Engine initialized")
     
+    def _get_collection(self):
+        """Open (or create, with the configured HNSW settings) the sermons collection."""
+        return self.client.get_or_create_collection(
+            config.CHROMA_COLLECTION, metadata=config.CHROMA_HNSW_SETTINGS
+        )
+    
     def add_documents(self, documents: List[Document]):
-        """Add documents to vector store."""
+        """
+        Add documents to vector store, in config.CHROMA_ADD_BATCH_SIZE batches.
+        Each batch is embedded in one request, several batches in parallel.
+        """
         if not documents:
             return
         
+        size = config.CHROMA_ADD_BATCH_SIZE
+        batches = [documents[i:i + size] for i in range(0, len(documents), size)]
+        
+        def embed(batch: List[Document]) -> Optional[List[List[float]]]:
+            # One failing batch is logged and skipped; the rest still go in
+            try:
+                return self.embed_documents(batch)
+            except Exception as e:
+                logger.error(f"Error embedding {len(batch)} documents: {e}")
+                return None
+        
+        added = 0
+        with ThreadPoolExecutor(max_workers=min(EMBED_WORKERS, len(batches))) as pool:
+            for batch, vectors in zip(batches, pool.map(embed, batches)):
+                if vectors is not None and self.add_embedded_documents(batch, vectors):
+                    added += len(batch)
+        
+        logger.info(f"Added {added} of {len(documents)} documents to vector store")
+    
+    def embed_documents(self, documents: List[Document]) -> List[List[float]]:
+        """Compute embeddings for documents (network-bound, safe to call from threads)."""
+        return embeddings.embed_documents([doc.page_content for doc in documents])
+    
+    def add_embedded_documents(
+        self,
+        documents: List[Document],
+        vectors: List[List[float]],
+        ids: Optional[List[str]] = None
+    ) -> bool:
+        """Write documents with precomputed embeddings to the vector store."""
+        if not documents:
+            return True
+        
         try:
-            self.vectorstore.add_documents(documents)
+            with self._write_lock:
+                self.collection.upsert(
+                    ids=ids or [str(uuid.uuid4()) for _ in documents],
+                    embeddings=vectors,
+                    documents=[doc.page_content for doc in documents],
+                    # Chroma rejects None metadata values; readers default missing keys
+                    metadatas=[
+                        {key: value for key, value in doc.metadata.items() if value is not None}
+                        for doc in documents
+                    ]
+                )
             logger.info(f"Added {len(documents)} documents to vector store")
+            return True
         except Exception as e:
             logger.error(f"Error adding documents to vector store: {e}")
+            return False
+    
+    def delete_by_links(self, message_links: List[str]):
+        """Remove every stored chunk belonging to the given sermons."""
+        if not message_links:
+            return
+        
+        try:
+            with self._write_lock:
+                self.collection.delete(
+                    where={'message_link': {'$in': list(message_links)}}
+                )
+        except Exception as e:
+            logger.error(f"Error deleting documents from vector store: {e}")
+    
+    def count(self) -> int:
+        """Number of documents in the vector store."""
+        try:
+            return self.collection.count()
+        except Exception as e:
+            logger.error(f"Error counting vector store documents: {e}")
+            return 0
     
     def search(self, query: str, k: int = 20) -> List[Dict]:
         """
@@ -63,23 +225,50 @@ class RAGEngine:
         Returns top k most relevant sermons with metadata.
         """
         try:
-            # Perform similarity search
-            results = self.vectorstore.similarity_search_with_score(query, k=k)
+            # Embed once: the vector serves both the paraphrase lookup and the search
+            query_vector = None
+            cached = self.cache.get(query)
+            if cached is None:
+                query_vector = embed_query(query)
+                cached = self.cache.get(query, query_vector)
+            if cached is not None and cached[0] >= k:
+                return cached[1][:k]
+            if query_vector is None:
+                query_vector = embed_query(query)
+            
+            # Perform similarity search; sermons split into several chunks come
+            # back more than once, so over-fetch and keep the best chunk of each
+            results = self.collection.query(
+                query_embeddings=[query_vector.tolist()],
+                n_results=k * 2,
+                include=["metadatas", "distances"]
+            )
             
             # Format results
             sermons = []
-            for doc, score in results:
+            seen_links = set()
+            for metadata, distance in zip(results["metadatas"][0], results["distances"][0]):
+                metadata = metadata or {}
+                link = metadata.get('message_link', '')
+                if link in seen_links:
+                    continue
+                seen_links.add(link)
                 sermon = {
-                    'title': doc.metadata.get('title', 'Untitled'),
-                    'description': doc.metadata.get('description', ''),
-                    'message_link': doc.metadata.get('message_link', ''),
-                    'image_url': doc.metadata.get('image_url'),
-                    'channel': doc.metadata.get('channel', ''),
-                    'date': doc.metadata.get('date', ''),
-                    'theme': doc.metadata.get('theme', ''),
-                    'similarity_score': float(1 - score)  # Convert distance to similarity
+                    'title': metadata.get('title', 'Untitled'),
+                    'description': metadata.get('description', ''),
+                    'message_link': link,
+                    'image_url': metadata.get('image_url'),
+                    'channel': metadata.get('channel', ''),
+                    'date': metadata.get('date', ''),
+                    'theme': metadata.get('theme', ''),
+                    'similarity_score': float(1 - distance)  # Convert cosine distance to similarity
                 }
                 sermons.append(sermon)
+                if len(sermons) == k:
+                    break
+            
+            if sermons:
+                self.cache.set(query, query_vector, (k, sermons))
             
             logger.info(f"Found {len(sermons)} results for query: {query[:50]}")
             return sermons
@@ -92,86 +281,127 @@ class RAGEngine:
         """Clear all documents from vector store."""
         try:
             # Delete and recreate collection
-            self.vectorstore.delete_collection()
-            self.vectorstore = Chroma(
-                persist_directory=config.CHROMA_PATH,
-                embedding_function=embeddings,
-                collection_name="sermons"
-            )
+            with self._write_lock:
+                self.client.delete_collection(config.CHROMA_COLLECTION)
+                self.collection = self._get_collection()
+            self.cache = SemanticCache()
             logger.info("Vector store cleared")
         except Exception as e:
             logger.error(f"Error clearing vector store: {e}")
 
 
+class CrossEncoderReranker:
+    """Scores (query, sermon) pairs locally with a cross-encoder in one batched pass."""
+    
+    def __init__(self, model_name: str = config.RERANKER_MODEL):
+        self.model = None
+        try:
+            # Imported here: it pulls in torch, which only the bot's ranking needs
+            from sentence_transformers import CrossEncoder  # optional: local reranking
+        except ImportError:
+            logger.info("sentence-transformers not installed; ranking sermons with AI")
+            return
+        
+        try:
+            self.model = CrossEncoder(model_name)
+            logger.info(f"Loaded reranker model: {model_name}")
+        except Exception as e:
+            logger.error(f"Failed to load reranker {model_name}: {e}")
+    
+    @property
+    def available(self) -> bool:
+        return self.model is not None
+    
+    def rank(self, query: str, sermons: List[Dict], min_score: float = config.RERANK_MIN_SCORE) -> List[int]:
+        """Sermon indexes ordered by descending score, dropping those below min_score."""
+        pairs = [(query, f"{s['title']}. {s['description'][:400]}") for s in sermons]
+        scores = self.model.predict(pairs, batch_size=32, convert_to_numpy=True)
+        return [int(i) for i in np.argsort(-scores) if scores[i] >= min_score]
+
+
 class RecommendationEngine:
     """Intelligently ranks and filters sermon recommendations."""
     
     def __init__(self):
         self.cache = CacheManager()
+        self.semantic_cache = SemanticCache()
+        self.reranker = CrossEncoderReranker()
+        self._inflight: Dict[str, asyncio.Task] = {}  # query digest -> running ranking
+    
+    async def rank_sermons(self, query: str, sermons: List[Dict], user_id: int) -> List[Dict]:
+        """
+        Rank sermons for a query. Identical queries arriving while one is still
+        being ranked share that ranking instead of starting their own.
+        """
+        key = cache_digest(query.lower().strip())
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._rank_sermons(query, sermons, user_id))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info(f"Joining in-flight ranking for user {user_id}")
+        
+        # Shielded so one caller being cancelled doesn't cancel it for the others
+        return await asyncio.shield(task)
     
-    def rank_sermons(self, query: str, sermons: List[Dict], user_id: int) -> List[Dict]:
+    async def _rank_sermons(self, query: str, sermons: List[Dict], user_id: int) -> List[Dict]:
         """
-        Use AI to intelligently rank sermons by relevance.
-        Filters out low-quality matches and removes duplicates.
+        Rank sermons by relevance, locally with the cross-encoder when available
+        and with AI otherwise. Removes duplicates first, then filters out
+        low-quality matches.
         """
+        # Remove duplicates up front so the ranker only sees unique candidates
+        sermons = self._dedup_by_link(sermons)
         if not sermons:
             return []
         
-        # Check cache first
-        cache_key = f"rank_{user_id}_{hashlib.md5(query.encode()).hexdigest()}"
-        cached = self.cache.get(cache_key)
+        # Fast path without the local reranker: short queries, or a clear
+        # similarity winner, gain nothing from an AI ranking round-trip -
+        # trust the vector store's order
+        if not self.reranker.available:
+            by_score = sorted(sermons, key=lambda s: s.get('similarity_score', 0), reverse=True)
+            margin = (
+                by_score[0].get('similarity_score', 0) - by_score[1].get('similarity_score', 0)
+                if len(by_score) > 1 else 1.0
+            )
+            if len(query.split()) <= config.RANK_SKIP_MAX_WORDS or margin >= config.RANK_SKIP_MARGIN:
+                logger.info(f"Ranking by similarity alone for query: {query[:50]}")
+                return by_score
+        
+        # Check caches first: in-memory exact/paraphrase, then the file cache
+        cached = self.semantic_cache.get(query)
+        if cached:
+            logger.info(f"Using cached ranking for user {user_id}")
+            return cached
+        
+        cache_key = f"rank_{user_id}_{cache_digest(query)}"
+        cached = await self.cache.aget(cache_key)
         if cached:
             logger.info(f"Using cached ranking for user {user_id}")
             return cached
         
         try:
-            # Prepare sermon summaries for AI
-            sermon_summaries = []
-            for i, sermon in enumerate(sermons):
-                summary = f"{i}. {sermon['title']}\n{sermon['description'][:200]}..."
-                sermon_summaries.append(summary)
-            
-            # Ask AI to rank by relevance
-            prompt = f"""You are helping recommend sermons from Pastor Tara Akinkuade.
-
-User query: "{query}"
-
-Available sermons:
-{chr(10).join(sermon_summaries[:15])}
-
-Task: Return a JSON array of sermon indexes (0-{min(14, len(sermon_summaries)-1)}) ranked by relevance to the query.
-Only include sermons that are truly relevant (relevance score >= 0.7).
-Return ONLY the JSON array, nothing else.
-
-Example: [3, 0, 7, 1]
-"""
+            # Embedding and model calls block; run them off the event loop
+            query_vector = await asyncio.to_thread(embed_query, query)
+            cached = self.semantic_cache.get(query, query_vector)
+            if cached:
+                logger.info(f"Using cached ranking of a similar query for user {user_id}")
+                return cached
             
-            response = llm.invoke(prompt)
-            content = response.content.strip()
-            
-            # Parse AI response
-            if content.startswith('[') and content.endswith(']'):
-                ranked_indexes = json.loads(content)
+            if self.reranker.available:
+                ranked_indexes = await asyncio.to_thread(self.reranker.rank, query, sermons)
             else:
-                # Fallback: use original order
-                ranked_indexes = list(range(min(10, len(sermons))))
-            
-            # Reorder sermons based on AI ranking
-            ranked_sermons = []
-            seen_links = set()
+                ranked_indexes = await self._llm_rank(query, sermons)
             
-            for idx in ranked_indexes:
-                if 0 <= idx < len(sermons):
-                    sermon = sermons[idx]
-                    link = sermon['message_link']
-                    
-                    # Remove duplicates
-                    if link not in seen_links:
-                        ranked_sermons.append(sermon)
-                        seen_links.add(link)
+            # Reorder sermons based on ranking (dropping any index repeated by the AI)
+            ranked_sermons = self._dedup_by_link(
+                sermons[idx] for idx in ranked_indexes if 0 <= idx < len(sermons)
+            )
             
             # Cache the results
-            self.cache.set(cache_key, ranked_sermons)
+            await self.cache.aset(cache_key, ranked_sermons)
+            self.semantic_cache.set(query, query_vector, ranked_sermons)
             
             logger.info(f"Ranked {len(ranked_sermons)} sermons for query: {query[:50]}")
             return ranked_sermons
@@ -180,12 +410,54 @@ Example: [3, 0, 7, 1]
             logger.error(f"Error ranking sermons: {e}")
             # Fallback: return original sermons filtered by similarity score
             return [s for s in sermons if s.get('similarity_score', 0) >= config.MIN_RELEVANCE_SCORE]
+    
+    @staticmethod
+    def _dedup_by_link(sermons) -> List[Dict]:
+        """Keep the first sermon per message_link, preserving order."""
+        unique = {}
+        for sermon in sermons:
+            unique.setdefault(sermon['message_link'], sermon)
+        return list(unique.values())
+    
+    async def _llm_rank(self, query: str, sermons: List[Dict]) -> List[int]:
+        """Ask the AI for sermon indexes ranked by relevance to the query."""
+        # Prepare summaries for the first 15 sermons only (all the prompt shows)
+        candidates = sermons[:15]
+        sermon_summaries = "\n".join(
+            f"{i}. {sermon['title']}\n{sermon['description'][:200]}..."
+            for i, sermon in enumerate(candidates)
+        )
+        
+        # Ask AI to rank by relevance
+        prompt = f"""You are helping recommend sermons from Pastor Tara Akinkuade.
+
+User query: "{query}"
+
+Available sermons:
+{sermon_summaries}
+
+Task: Return a JSON array of sermon indexes (0-{len(candidates) - 1}) ranked by relevance to the query.
+Only include sermons that are truly relevant (relevance score >= 0.7).
+Return ONLY the JSON array, nothing else.
+
+Example: [3, 0, 7, 1]
+"""
+        
+        response = await chat_model().ainvoke(prompt)
+        content = response.content.strip()
+        
+        # Parse AI response
+        if content.startswith('[') and content.endswith(']'):
+            return json.loads(content)
+        
+        # Fallback: use original order
+        return list(range(min(10, len(sermons))))
 
 
 class ResponseGenerator:
     """Generates warm, pastoral responses with AI."""
     
-    def generate_response(self, query: str, sermons: List[Dict], num_requested: int = 5) -> str:
+    async def generate_response(self, query: str, sermons: List[Dict], num_requested: int = 5) -> str:
         """
         Generate a warm, encouraging response with Bible verse.
         Does NOT include sermon recommendations (those are sent separately as photos).
@@ -207,7 +479,7 @@ Example tone:
 "I hear your heart, beloved! 🙏 Remember, *'Be strong and courageous. Do not be afraid; do not be discouraged, for the Lord your God will be with you wherever you go.'* - Joshua 1:9 📖 God is with you in this season, and His word will guide you! ✨"
 """
             
-            response = llm.invoke(prompt)
+            response = await chat_model().ainvoke(prompt)
             return response.content.strip()
             
         except Exception as e:
@@ -218,52 +490,170 @@ Example tone:
         """
         Extract user intent: topic and number of recommendations requested.
         """
-        try:
-            # Simple pattern matching for number
-            num = config.DEFAULT_RECOMMENDATIONS
-            for word in message.split():
-                if word.isdigit():
-                    num = min(int(word), 20)  # Max 20 at once
-                    break
-            
-            # Topic is the whole message (RAG will handle it)
-            return {
-                'topic': message,
-                'num_requested': num
-            }
-            
-        except Exception as e:
-            logger.error(f"Error extracting intent: {e}")
-            return {
-                'topic': message,
-                'num_requested': config.DEFAULT_RECOMMENDATIONS
-            }
+        # First standalone 1-3 digit number, punctuation allowed ("5 sermons," / "5.")
+        match = _NUM_RE.search(message)
+        num = min(int(match.group(1)), 20) if match else config.DEFAULT_RECOMMENDATIONS  # Max 20 at once
+        
+        # Topic is the whole message (RAG will handle it)
+        return {
+            'topic': message,
+            'num_requested': num
+        }
+
+
+class TTLCache:
+    """
+    Small in-memory LRU cache whose entries also expire after `ttl` seconds.
+    Dict-like: supports get(), [] access, `in`, pop() and len().
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at, value)
+    
+    def get(self, key, default=None):
+        """Get a live entry (refreshing its LRU position) or `default`."""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def __getitem__(self, key):
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def __contains__(self, key) -> bool:
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+    
+    def __delitem__(self, key):
+        del self._data[key]
+    
+    def pop(self, key, default=None):
+        """Remove an entry and return its value (or `default`)."""
+        value = self.get(key, default)
+        self._data.pop(key, None)
+        return value
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SemanticCache:
+    """
+    Two-tier in-memory query cache: exact hits by hashed query text, then
+    near-duplicate hits by cosine similarity of query embeddings, so
+    paraphrased queries share an entry. Holds at most `maxsize` entries
+    (oldest overwritten first); entries expire after `ttl` seconds.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600, threshold: float = 0.9):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self._keys = {}  # digest of normalized query -> slot
+        self._slot_keys = [None] * maxsize
+        self._values = [None] * maxsize
+        self._expires = np.zeros(maxsize)  # monotonic expiry per slot, 0 = empty
+        self._emb = None  # (maxsize, dim) unit vectors, allocated on first set
+        self._next = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(query: str) -> str:
+        return cache_digest(query.lower().strip())
+    
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        vec = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+    
+    def get(self, query: str, vector=None) -> Optional[any]:
+        """
+        Exact match on the query text; given its embedding too, fall back to
+        the most similar live entry scoring at least `threshold`.
+        """
+        now = time.monotonic()
+        with self._lock:
+            slot = self._keys.get(self._key(query))
+            if slot is None and vector is not None and self._emb is not None:
+                scores = self._emb @ self._normalize(vector)
+                scores[self._expires <= now] = -1.0
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    slot = best
+            if slot is None or self._expires[slot] <= now:
+                return None
+            return self._values[slot]
+    
+    def set(self, query: str, vector, value):
+        """Store a value under the query text and its embedding."""
+        vec = self._normalize(vector)
+        key = self._key(query)
+        with self._lock:
+            if self._emb is None:
+                self._emb = np.zeros((self.maxsize, vec.shape[0]), dtype=np.float32)
+            slot = self._keys.get(key)
+            if slot is None:
+                slot = self._next
+                self._next = (slot + 1) % self.maxsize
+                old_key = self._slot_keys[slot]
+                if old_key is not None:
+                    self._keys.pop(old_key, None)
+                self._keys[key] = slot
+                self._slot_keys[slot] = key
+            self._emb[slot] = vec
+            self._values[slot] = value
+            self._expires[slot] = time.monotonic() + self.ttl
 
 
 class CacheManager:
-    """Simple file-based caching for fast responses."""
+    """
+    Expiring key/value cache for fast responses, in one SQLite (WAL) file.
+    Values are stored as JSON (orjson when installed); expired rows are skipped on read and purged
+    in bulk every few minutes instead of per lookup.
+    """
     
-    def __init__(self):
-        os.makedirs(config.CACHE_PATH, exist_ok=True)
+    PURGE_INTERVAL = 600  # seconds between bulk deletes of expired rows
+    
+    def __init__(self, path: str = config.RESPONSE_CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache(expires_at)")
+        self._next_purge = 0.0
     
     def get(self, key: str) -> Optional[any]:
         """Get cached data if not expired."""
-        cache_file = os.path.join(config.CACHE_PATH, f"{key}.json")
-        
-        if not os.path.exists(cache_file):
-            return None
-        
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Check expiration
-            expires_at = datetime.fromisoformat(data['expires_at'])
-            if datetime.now() > expires_at:
-                os.remove(cache_file)
-                return None
-            
-            return data['value']
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                    (key, int(time.time()))
+                ).fetchone()
+            return fast_json.loads(row[0]) if row else None
             
         except Exception as e:
             logger.error(f"Error reading cache: {e}")
@@ -271,21 +661,72 @@ class CacheManager:
     
     def set(self, key: str, value: any):
         """Cache data with expiration."""
-        cache_file = os.path.join(config.CACHE_PATH, f"{key}.json")
-        
-        expires_at = datetime.now() + timedelta(hours=config.CACHE_DURATION_HOURS)
+        expires_at = int(time.time()) + config.CACHE_DURATION_HOURS * 3600
         
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'value': value,
-                    'expires_at': expires_at.isoformat()
-                }, f)
+            # orjson returns bytes, json a str; both loaders accept either
+            payload = fast_json.dumps(value)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, payload, expires_at)
+                )
+                self._purge_expired()
         except Exception as e:
             logger.error(f"Error writing cache: {e}")
+    
+    async def aget(self, key: str) -> Optional[any]:
+        """get() without blocking the event loop."""
+        return await asyncio.to_thread(self.get, key)
+    
+    async def aset(self, key: str, value: any):
+        """set() without blocking the event loop."""
+        await asyncio.to_thread(self.set, key, value)
+    
+    def _purge_expired(self):
+        """Delete expired rows, at most once per PURGE_INTERVAL (caller holds the lock)."""
+        now = time.monotonic()
+        if now < self._next_purge:
+            return
+        self._next_purge = now + self.PURGE_INTERVAL
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (int(time.time()),))
+
+
+# Global instances - created on first use, then shared by the whole process
+_singleton_lock = threading.RLock()
+
+
+def _singleton(factory):
+    """functools.cache for a zero-argument factory, safe when first called from several threads."""
+    cached = functools.cache(factory)
+    
+    @functools.wraps(factory)
+    def get():
+        with _singleton_lock:
+            return cached()
+    
+    return get
+
+
+@_singleton
+def get_db() -> SermonDatabase:
+    """The shared sermon database (one connection for the whole process)."""
+    return SermonDatabase(config.DB_PATH)
+
+
+@_singleton
+def get_rag_engine() -> RAGEngine:
+    """The shared RAG engine (opens the Chroma store on first call)."""
+    return RAGEngine()
+
+
+@_singleton
+def get_recommendation_engine() -> RecommendationEngine:
+    """The shared recommendation engine (loads the reranker on first call)."""
+    return RecommendationEngine()
 
 
-# Global instances - initialized when module is imported
-rag_engine = RAGEngine()
-recommendation_engine = RecommendationEngine()
-response_generator = ResponseGenerator()
\ No newline at end of file
+@_singleton
+def get_response_generator() -> ResponseGenerator:
+    """The shared response generator."""
+    return ResponseGenerator()
\ No newline at end of file
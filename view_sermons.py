@@ -1,35 +1,39 @@
 """
 View all scraped sermons from the database
 """
+import sys
+from collections import Counter
+
 from db_handler import SermonDatabase
 import config
 
 db = SermonDatabase(config.DB_PATH)
 
-# Get all sermons
-sermons = db.get_all_sermons()
-
 print(f"\n{'='*80}")
-print(f"TOTAL SERMONS: {len(sermons)}")
+print(f"TOTAL SERMONS: {db.get_sermon_count()}")
 print(f"{'='*80}\n")
 
-for i, sermon in enumerate(sermons, 1):
-    print(f"{i}. {sermon['title']}")
-    print(f"   Channel: {sermon['channel']}")
-    print(f"   Date: {sermon['date']}")
-    print(f"   Theme: {sermon['theme']}")
-    print(f"   Link: {sermon['message_link']}")
-    print(f"   Description: {sermon['description'][:100]}...")
-    print()
+# Stream sermons from the DB, counting per channel in the same pass;
+# one write per sermon instead of one per line
+channels = Counter()
+rows = db.iter_sermons(('title', 'channel', 'date', 'theme', 'message_link', 'description'))
+for i, (title, channel, date, theme, link, description) in enumerate(rows, 1):
+    channels[channel] += 1
+    sys.stdout.write(
+        f"{i}. {title}\n"
+        f"   Channel: {channel}\n"
+        f"   Date: {date}\n"
+        f"   Theme: {theme}\n"
+        f"   Link: {link}\n"
+        f"   Description: {description[:100]}...\n"
+        "\n"
+    )
 
-# Summary by channel
-channels = {}
-for sermon in sermons:
-    channel = sermon['channel']
-    channels[channel] = channels.get(channel, 0) + 1
+# Summary by channel, busiest first
 
 print(f"\n{'='*80}")
 print("SERMONS BY CHANNEL:")
 print(f"{'='*80}")
-for channel, count in channels.items():
-    print(f"{channel}: {count} sermons")
\ No newline at end of file
+sys.stdout.write("".join(
+    f"{channel}: {count} sermons\n" for channel, count in channels.most_common()
+))